@@ -1,6 +1,6 @@
 """Sumo_Curve package for advanced risk survival calculations."""
 
-from .risk import (
+from .risk_after_cover import (
     R_survival,
     breakeven,
 )
@@ -8,4 +8,4 @@ from .risk import (
 __all__ = [
     "R_survival",
     "breakeven",
-] 
\ No newline at end of file
+] 
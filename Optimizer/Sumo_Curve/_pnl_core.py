@@ -0,0 +1,65 @@
+"""Numba kernels for the intraday PnL calculator.
+
+Kept free of pandas so the loops compile in nopython mode; callers hand in
+plain NumPy arrays pulled from the fills DataFrame.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def compute_pnl_core(signed_qty, price, period_id, timestamp):
+    """Return the intraday PnL after each trade.
+
+    Walks the (time-sorted) trades once, carrying position and cost and
+    resetting both whenever ``period_id`` changes. Trades sharing a
+    ``timestamp`` are valued against the position after the whole group,
+    matching the "all trades in the period up to now" definition.
+    """
+    n = signed_qty.shape[0]
+    positions = np.empty(n)
+    costs = np.empty(n)
+
+    cumulative_position = 0.0
+    total_cost = 0.0
+
+    for i in range(n):
+        if i == 0 or period_id[i] != period_id[i - 1]:
+            cumulative_position = 0.0
+            total_cost = 0.0
+
+        trade_signed_qty = signed_qty[i]
+        trade_price = price[i]
+
+        if cumulative_position * trade_signed_qty >= 0:
+            # Same direction or starting from flat
+            total_cost += trade_signed_qty * trade_price
+            cumulative_position += trade_signed_qty
+        elif abs(trade_signed_qty) <= abs(cumulative_position):
+            # Partial close
+            cumulative_position += trade_signed_qty
+        else:
+            # Full close and reverse
+            remaining_qty = trade_signed_qty + cumulative_position
+            total_cost = remaining_qty * trade_price
+            cumulative_position = remaining_qty
+
+        positions[i] = cumulative_position
+        costs[i] = total_cost
+
+    # Earlier trades in a same-timestamp group see the group's final state
+    for i in range(n - 2, -1, -1):
+        if timestamp[i] == timestamp[i + 1]:
+            positions[i] = positions[i + 1]
+            costs[i] = costs[i + 1]
+
+    pnls = np.empty(n)
+    for i in range(n):
+        if positions[i] != 0:
+            avg_price = costs[i] / positions[i]
+            pnls[i] = positions[i] * (price[i] - avg_price)
+        else:
+            pnls[i] = 0.0
+
+    return pnls
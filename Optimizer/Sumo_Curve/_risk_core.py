@@ -0,0 +1,194 @@
+"""Numba kernels for the R_survival / R_dict inner math.
+
+The public kernels are declared with explicit signatures, so Numba compiles
+them eagerly when this module is imported (or loads them from the on-disk
+cache) instead of stalling the first market tick that reaches R_survival or
+R_dict.
+"""
+
+import numpy as np
+from numba import float32, float64, int64, njit, prange
+from numba.types import Tuple
+
+_INV_16 = 1.0 / 16.0
+# Levels within this distance of the current price are skipped (3 ticks of 1/16)
+_MIN_DIST = 3 / 16
+# 16 / breakeven for levels above the current price (the negative below it),
+# so the kernels multiply instead of dividing
+_INV_BE16 = 16 / 3
+# Below this length the sequential cumprod beats the parallel scan's overhead
+_PARALLEL_SCAN_MIN = 64
+
+
+@njit(float64[:](float64[:], float64[:], float64), cache=True)
+def coeff_products(levels, deltas, cp_dec):
+    """Cumulative coefficient products for one direction of travel.
+
+    coeff[k] = deltas[0] * prod_{i=1..k} (1 + deltas[i] / (breakeven(levels[i]) / 16)),
+    multiplied left to right exactly like the original notebook loop.
+    """
+    n = deltas.shape[0]
+    if n == 0 or deltas[0] == 0.0:
+        return deltas[:0].copy()
+
+    coeffs = deltas.copy()
+    prod = deltas[0]
+    for i in range(1, n):
+        be = -3.0 if cp_dec > levels[i] else 3.0
+        prod *= 1 + deltas[i] / (be / 16)
+        coeffs[i] = prod
+    return coeffs
+
+
+@njit(int64(float64[:], float64, float64), cache=True)
+def find_extreme_index(coeffs, risk, new_stop):
+    """Index of the first level whose PnL reaches ``new_stop`` (len(coeffs) if none).
+
+    risk * coeff * 16 is monotonically decreasing along the chosen side, so
+    the first breach is found by bisection.
+    """
+    lo = 0
+    hi = coeffs.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if coeffs[mid] * risk * 16 <= new_stop:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+@njit(parallel=True, cache=True)
+def _parallel_cumprod(x):
+    """Inclusive cumulative product by a work-efficient (Blelloch) scan.
+
+    The up-sweep leaves each tree node holding the product of its subtree,
+    the down-sweep turns that into an exclusive scan; every level of both
+    sweeps is a prange over independent nodes, so the critical path is
+    O(log n) instead of n. Products are grouped differently from np.cumprod,
+    so results can differ from it in the last bits.
+    """
+    n = x.shape[0]
+    size = 1
+    while size < n:
+        size *= 2
+    tree = np.ones(size)
+    tree[:n] = x
+
+    step = 1
+    while step < size:
+        stride = 2 * step
+        for j in prange(size // stride):
+            k = (j + 1) * stride - 1
+            tree[k] = tree[k - step] * tree[k]
+        step = stride
+
+    tree[size - 1] = 1.0
+    step = size // 2
+    while step >= 1:
+        stride = 2 * step
+        for j in prange(size // stride):
+            k = (j + 1) * stride - 1
+            left = tree[k - step]
+            tree[k - step] = tree[k]
+            tree[k] = tree[k] * left
+        step //= 2
+
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = tree[i] * x[i]
+    return out
+
+
+@njit(cache=True, boundscheck=False)
+def _r_dict_side(levels, inv_be16, stop_loss):
+    """R0 and the coefficient products for one side of the ladder."""
+    n = levels.shape[0] - 1
+    if n < 1:
+        # Bounds checks are off, so an empty side would read and write past coeff
+        raise IndexError("a ladder side needs the current price and at least one level")
+    if n < _PARALLEL_SCAN_MIN:
+        # Filled in place, left to right, without the delta/factor temporaries
+        coeff = np.empty(n)
+        coeff[0] = levels[1] - levels[0]
+        for i in range(1, n):
+            coeff[i] = coeff[i - 1] * (1 + (levels[i + 1] - levels[i]) * inv_be16)
+    else:
+        deltas = np.diff(levels)
+        coeff = _parallel_cumprod(np.concatenate((deltas[:1], 1 + deltas[1:] * inv_be16)))
+    return stop_loss / coeff[-1] * _INV_16, coeff
+
+
+@njit("UniTuple(f8, 2)(f8[::1], f8[::1], f8, f8, f8[::1], f4[::1])", cache=True, boundscheck=False)
+def r_dict_kernel(levels_above, levels_below, cp, stop_loss, out_levels, out_risks):
+    """Write the ascending risk ladder into ``out_levels`` / ``out_risks`` and return (R0_above, R0_below).
+
+    ``levels_above`` / ``levels_below`` start at the current price ``cp`` and
+    every other entry lies strictly above / below it, so breakeven is the
+    same on a whole side: +3 above, -3 below. Each side must hold at least
+    two entries (``cp`` and one level), else IndexError is raised. The first
+    len(levels_above) + len(levels_below) - 1 slots of the outputs are filled:
+    levels_below[1:] (farthest first), ``cp`` carrying R0_above, then
+    levels_above[1:]. All arrays must be C-contiguous; the risks are computed
+    in float64 and rounded to float32 only when stored.
+    """
+    n_above = levels_above.shape[0]
+    n_below = levels_below.shape[0]
+    r0_above, coeff_above = _r_dict_side(levels_above, _INV_BE16, stop_loss)
+    r0_below, coeff_below = _r_dict_side(levels_below, -_INV_BE16, stop_loss)
+
+    i_cp = n_below - 1
+    out_levels[i_cp] = cp
+    out_risks[i_cp] = np.float32(r0_above)
+    for i in range(1, n_above):
+        out_levels[i_cp + i] = levels_above[i]
+        out_risks[i_cp + i] = np.float32(r0_above * coeff_above[i - 1] * _INV_BE16)
+    for i in range(1, n_below):
+        out_levels[i_cp - i] = levels_below[i]
+        out_risks[i_cp - i] = np.float32(r0_below * coeff_below[i - 1] * -_INV_BE16)
+    return r0_above, r0_below
+
+
+@njit(cache=True, boundscheck=False)
+def _ladder_side(tech_levels, cp, lo, hi, ascending):
+    """``cp`` followed by the tech levels in [lo, hi] that are at least _MIN_DIST from it.
+
+    Ordered away from ``cp``: ascending above it, descending below it.
+    """
+    i = np.searchsorted(tech_levels, lo, side='left')
+    j = np.searchsorted(tech_levels, hi, side='right')
+    if i == j:
+        raise IndexError("no technical level within NBM of the current price")
+
+    levels = np.empty(j - i + 1)
+    levels[0] = cp
+    n = 1
+    if ascending:
+        for k in range(i, j):
+            if tech_levels[k] - cp >= _MIN_DIST:
+                levels[n] = tech_levels[k]
+                n += 1
+    else:
+        for k in range(j - 1, i - 1, -1):
+            if cp - tech_levels[k] >= _MIN_DIST:
+                levels[n] = tech_levels[k]
+                n += 1
+    if n < 2:
+        raise IndexError("no technical level within NBM of the current price")
+    return levels[:n]
+
+
+@njit(Tuple((int64, float64, float64))(float64[::1], float64, float64, float64, float64[::1], float32[::1]),
+      cache=True, boundscheck=False)
+def r_dict_ladder(tech_levels, cp, nbm_width, stop_loss, out_levels, out_risks):
+    """Whole R_dict tick in one native call: select, filter and price the ladder.
+
+    ``tech_levels`` must be sorted ascending and the outputs must hold at least
+    len(tech_levels) + 1 entries. Returns (n, R0_above, R0_below), with the
+    first ``n`` slots of ``out_levels`` / ``out_risks`` filled as by
+    r_dict_kernel.
+    """
+    levels_above = _ladder_side(tech_levels, cp, cp, cp + nbm_width, True)
+    levels_below = _ladder_side(tech_levels, cp, cp - nbm_width, cp, False)
+    r0_above, r0_below = r_dict_kernel(levels_above, levels_below, cp, stop_loss, out_levels, out_risks)
+    return levels_above.shape[0] + levels_below.shape[0] - 1, r0_above, r0_below
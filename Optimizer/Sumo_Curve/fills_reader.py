@@ -0,0 +1,163 @@
+"""
+Incremental reader for the append-only continuous fills CSV.
+Polling monitors call refresh() every cycle; the file is only touched when its
+size or mtime has changed, and then only the newly appended bytes are parsed.
+"""
+
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+# Every column is pinned so Arrow's per-chunk type inference cannot turn
+# Date/Time into date32/time64, OrderId into something numeric, or the
+# 19-digit ids into float64 (e.g. when a tail chunk has no rows).
+FILL_COLUMN_TYPES = {
+    'Date': pa.string(),
+    'Time': pa.string(),
+    'InstrumentId': pa.uint64(),
+    'InstrumentName': pa.string(),
+    'Side': pa.int64(),
+    'SideName': pa.string(),
+    'Quantity': pa.float64(),
+    'Price': pa.float64(),
+    'OrderId': pa.string(),
+    'AccountId': pa.int64(),
+    'MarketId': pa.int64(),
+    'TransactTime': pa.int64(),
+    'TimeStamp': pa.int64(),
+    'ExecId': pa.string(),
+    'OrderStatus': pa.int64(),
+    'Exchange': pa.string(),
+    'Contract': pa.string(),
+    'Originator': pa.string(),
+    'CurrentUser': pa.string(),
+}
+
+# Bytes before the read offset that must be unchanged for the file to count as appended to
+TAIL_CHECK_BYTES = 256
+
+
+def read_fills_csv(source, column_names=None, usecols=None, filters=None):
+    """Parse a fills CSV with Arrow's multi-threaded reader and return a pandas DataFrame.
+
+    ``column_names`` is for header-less input (e.g. a tail of the file);
+    ``usecols`` limits which columns are materialised. ``filters`` maps column
+    name to required value and is applied to the Arrow table, so rows that do
+    not match are never converted to pandas objects.
+    """
+    table, _ = _read_fills_table(source, column_names, usecols, filters)
+    return table.to_pandas()
+
+
+def _read_fills_table(source, column_names, usecols, filters):
+    """Return the (filtered) Arrow table and the number of rows parsed."""
+    read_options = pa_csv.ReadOptions(column_names=column_names)
+    convert_options = pa_csv.ConvertOptions(
+        column_types=FILL_COLUMN_TYPES,
+        include_columns=usecols,
+        strings_can_be_null=True,
+    )
+    table = pa_csv.read_csv(source, read_options=read_options, convert_options=convert_options)
+    rows_parsed = table.num_rows
+
+    if filters:
+        mask = None
+        for column, value in filters.items():
+            column_mask = pc.equal(table[column], value)
+            mask = column_mask if mask is None else pc.and_(mask, column_mask)
+        table = table.filter(mask)
+
+    return table, rows_parsed
+
+
+class FillsTailReader:
+    """Cache the parsed rows of a growing CSV and parse only what was appended.
+
+    ``row_count`` is the number of data rows consumed from the file and
+    ``match_count`` the number of those that passed ``filters``. The rows
+    themselves are not kept; callers accumulate what they need.
+    """
+
+    def __init__(self, file_path, usecols=None, filters=None):
+        self.file_path = file_path
+        self.usecols = usecols
+        self.filters = filters
+        self.reset()
+
+    def reset(self):
+        """Forget everything read so far; the next refresh re-reads the whole file."""
+        self.row_count = 0
+        self.match_count = 0
+        self._columns = None
+        self._offset = 0
+        self._checked = b''
+        self._file_id = None
+        self._size = None
+        self._mtime = None
+
+    def refresh(self):
+        """Parse what was appended since the last call.
+
+        Only complete lines are consumed, so a row that is half-written when we
+        poll is picked up on the next call. If the file was replaced, shrank, or
+        was rewritten in place (the bytes just before the read offset changed),
+        the reader starts over from the beginning of the file.
+
+        Returns:
+            tuple: ``(new_rows, reset)``. ``new_rows`` is a DataFrame of the
+            matching rows appended, or None if no complete line was added.
+            ``reset`` is True when the reader started over (including the first
+            call), in which case callers must drop whatever they built from
+            earlier rows before using ``new_rows``.
+        """
+        stat = os.stat(self.file_path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id == self._file_id and stat.st_size == self._size and stat.st_mtime == self._mtime:
+            return None, False
+
+        reset = False
+        if file_id != self._file_id or stat.st_size < self._offset:
+            self.reset()
+            self._file_id = file_id
+            reset = True
+
+        with open(self.file_path, 'rb') as f:
+            f.seek(self._offset - len(self._checked))
+            tail = f.read()
+            if not tail.startswith(self._checked):
+                # Same file and no shorter, but the text we already read changed
+                self.reset()
+                self._file_id = file_id
+                reset = True
+                f.seek(0)
+                tail = f.read()
+        tail = tail[len(self._checked):]
+
+        end = tail.rfind(b'\n') + 1
+        if end == 0:
+            self._size = stat.st_size
+            self._mtime = stat.st_mtime
+            return None, reset
+        tail = tail[:end]
+
+        if self._columns is None:
+            header = tail[:tail.index(b'\n')].decode().strip()
+            self._columns = header.split(',')
+            table, rows_parsed = _read_fills_table(io.BytesIO(tail), None, self.usecols, self.filters)
+        else:
+            table, rows_parsed = _read_fills_table(io.BytesIO(tail), self._columns, self.usecols, self.filters)
+        new_rows = table.to_pandas()
+
+        self._checked = (self._checked + tail[-TAIL_CHECK_BYTES:])[-TAIL_CHECK_BYTES:]
+        self._offset += end
+        self._size = stat.st_size
+        self._mtime = stat.st_mtime
+        self.row_count += rows_parsed
+        new_rows.index = pd.RangeIndex(self.match_count, self.match_count + len(new_rows))
+        self.match_count += len(new_rows)
+
+        return new_rows, reset
@@ -3,8 +3,8 @@ import os
 # Add the workspace root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, time, timedelta
 
 def calculate_intraday_pnl():
     """
@@ -12,8 +12,12 @@ def calculate_intraday_pnl():
     Intraday period: 3 PM day n-1 to 3 PM day n
     """
     
-    # Read the CSV file
-    df = pd.read_csv('data/output/ladder/continuous_fills.csv')
+    # Read the CSV file; the low-cardinality filter columns are read as
+    # categoricals so the masks below compare integer codes, not strings
+    df = pd.read_csv(
+        'data/output/ladder/continuous_fills.csv',
+        dtype={'Exchange': 'category', 'CurrentUser': 'category', 'Contract': 'category', 'SideName': 'category'},
+    )
     
     # Filter for CME, Eric, ZN Sep25
     filtered_df = df[
@@ -35,40 +39,25 @@ def calculate_intraday_pnl():
     filtered_df = filtered_df.sort_values('DateTime')
     
     # Define signed quantity: BUY = +, SELL = -
-    filtered_df['SignedQuantity'] = filtered_df.apply(
-        lambda row: row['Quantity'] if row['SideName'] == 'BUY' else -row['Quantity'], 
-        axis=1
-    )
-    
-    # Group trades by intraday periods (3 PM to 3 PM next day)
-    results = []
+    qty = filtered_df['Quantity'].to_numpy()
+    is_buy = (filtered_df['SideName'] == 'BUY').to_numpy()
+    filtered_df['SignedQuantity'] = np.where(is_buy, qty, -qty)
     
-    for _, trade in filtered_df.iterrows():
-        trade_date = trade['DateTime'].date()
-        trade_time = trade['DateTime'].time()
-        
-        # Determine intraday period
-        if trade_time >= time(15, 0):  # 3 PM or later
-            period_start = datetime.combine(trade_date, time(15, 0))
-            period_end = datetime.combine(trade_date + timedelta(days=1), time(15, 0))
-        else:  # Before 3 PM
-            period_start = datetime.combine(trade_date - timedelta(days=1), time(15, 0))
-            period_end = datetime.combine(trade_date, time(15, 0))
-        
-        period_name = f'{period_start.strftime("%Y-%m-%d")} 3PM to {period_end.strftime("%Y-%m-%d")} 3PM'
-        
-        results.append({
-            'Period': period_name,
-            'DateTime': trade['DateTime'],
-            'Side': trade['SideName'],
-            'Quantity': trade['Quantity'],
-            'SignedQuantity': trade['SignedQuantity'],
-            'Price': trade['Price'],
-            'OrderId': trade['OrderId']
-        })
+    # Group trades by intraday periods (3 PM to 3 PM next day).
+    # Shifting back 15 hours maps every trade onto the calendar day its
+    # period started, so a single floor gives the 3 PM period start.
+    period_start = (filtered_df['DateTime'] - pd.Timedelta(hours=15)).dt.floor('D') + pd.Timedelta(hours=15)
+    period_end = period_start + pd.Timedelta(days=1)
     
-    # Convert to DataFrame for analysis
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame({
+        'Period': period_start.dt.strftime('%Y-%m-%d') + ' 3PM to ' + period_end.dt.strftime('%Y-%m-%d') + ' 3PM',
+        'DateTime': filtered_df['DateTime'],
+        'Side': filtered_df['SideName'],
+        'Quantity': filtered_df['Quantity'],
+        'SignedQuantity': filtered_df['SignedQuantity'],
+        'Price': filtered_df['Price'],
+        'OrderId': filtered_df['OrderId'],
+    })
     
     # Calculate PnL by period
     pnl_by_period = {}
@@ -81,9 +70,9 @@ def calculate_intraday_pnl():
         cumulative_cost = 0
         period_pnl = 0
         
-        for _, trade in period_trades.iterrows():
-            signed_qty = trade['SignedQuantity']
-            price = trade['Price']
+        for trade in period_trades.itertuples(index=False):
+            signed_qty = trade.SignedQuantity
+            price = trade.Price
             
             if cumulative_position == 0:
                 # Opening position
@@ -8,24 +8,27 @@ Uses file tail monitoring for continuous processing.
 import pandas as pd
 import numpy as np
 from datetime import datetime, time, timedelta
+import logging
 import os
 import sys
 import time as time_module
-import pickle
 
 # Add workspace root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
+from Optimizer.Sumo_Curve._pnl_core import compute_pnl_core
+from Optimizer.Sumo_Curve.fills_reader import FillsTailReader, read_fills_csv
+
+# Timestamps come from the handler's formatter, only when a record is emitted
+logger = logging.getLogger(__name__)
+
 def load_fills_data(file_path):
     """Load and filter the continuous fills data"""
-    df = pd.read_csv(file_path)
-    
-    # Filter for CME, Eric, ZN Sep25
-    filtered_df = df[
-        (df['Exchange'] == 'CME') & 
-        (df['CurrentUser'] == 'Eric') & 
-        (df['Contract'] == 'ZN Sep25')
-    ].copy()
+    # Filter for CME, Eric, ZN Sep25 while parsing
+    filtered_df = read_fills_csv(
+        file_path,
+        filters={'Exchange': 'CME', 'CurrentUser': 'Eric', 'Contract': 'ZN Sep25'},
+    )
     
     # Convert Date and Time to datetime
     if not filtered_df.empty:
@@ -59,86 +62,64 @@ def calculate_intraday_pnl(df):
     if df.empty:
         return df
         
-    df = df.copy()
+    # sort_values already returns a new frame, so no defensive copy is needed
     df = df.sort_values('DateTime').reset_index(drop=True)
-    
-    intraday_pnls = []
     df = create_signed_quantity(df)
-    net_position = df['SignedQuantity'].sum()
     
-    for idx, row in df.iterrows():
-        current_datetime = row['DateTime']
-        current_price = row['Price']
-        current_signed_qty = row['SignedQuantity']
-        
-        # Get the start of the intraday period
-        period_start = get_intraday_period_start(current_datetime)
-        
-        # Get all trades in the same intraday period up to current trade
-        period_trades = df[
-            (df['DateTime'] >= period_start) & 
-            (df['DateTime'] <= current_datetime)
-        ].copy()
-        
-        # Calculate cumulative position and weighted average price
-        cumulative_position = 0
-        total_cost = 0
-        
-        for _, trade in period_trades.iterrows():
-            trade_signed_qty = trade['SignedQuantity']
-            trade_price = trade['Price']
-            
-            if cumulative_position * trade_signed_qty >= 0:
-                # Same direction or starting from flat
-                total_cost += trade_signed_qty * trade_price
-                cumulative_position += trade_signed_qty
-            else:
-                # Opposite direction - partial or full close
-                if abs(trade_signed_qty) <= abs(cumulative_position):
-                    # Partial close
-                    cumulative_position += trade_signed_qty
-                else:
-                    # Full close and reverse
-                    remaining_qty = trade_signed_qty + cumulative_position
-                    total_cost = remaining_qty * trade_price
-                    cumulative_position = remaining_qty
-        
-        # Calculate weighted average price
-        if cumulative_position != 0:
-            avg_price = total_cost / cumulative_position
-            # PnL = Position * (Current Price - Average Price)
-            pnl = cumulative_position * (current_price - avg_price)
-        else:
-            pnl = 0
-        
-        intraday_pnls.append(pnl)
+    # Pull raw arrays once; everything below works on NumPy, not DataFrame slices
+    date_time = df['DateTime'].to_numpy(dtype='datetime64[ns]')
+    signed_qty = df['SignedQuantity'].to_numpy(dtype=np.float64)
+    price = df['Price'].to_numpy(dtype=np.float64)
+    
+    # 3pm period id = calendar day of (DateTime - 15h), same rule as get_intraday_period_start
+    period_id = (date_time - np.timedelta64(15, 'h')).astype('datetime64[D]').view(np.int64)
+    
+    intraday_pnls = compute_pnl_core(signed_qty, price, period_id, date_time.view(np.int64))
     
     df['intraday_pnl'] = intraday_pnls
     return df
 
-def save_results(df, output_path):
-    """Save the results to CSV with duplicate prevention"""
-    # Remove any duplicates before saving
-    df_clean = df.drop_duplicates()
+def save_results(df, output_path, written_keys=None):
+    """Save the results to CSV with duplicate prevention
+    
+    When the caller passes a ``written_keys`` set, fills are identified by
+    OrderId + TimeStamp and only ones not already written are appended; the
+    first call (empty set) rewrites the file with a header.
+    """
+    if written_keys is None:
+        # Remove any duplicates before saving
+        df_clean = df.drop_duplicates()
+        df_clean.to_csv(output_path, index=False)
+        total_trades = len(df_clean)
+    else:
+        keys = df['OrderId'].astype(str) + '|' + df['TimeStamp'].astype(str)
+        is_new = ~keys.isin(written_keys) & ~keys.duplicated()
+        if written_keys:
+            df[is_new].to_csv(output_path, mode='a', header=False, index=False)
+        else:
+            df[is_new].to_csv(output_path, index=False)
+        written_keys.update(keys[is_new])
+        total_trades = len(written_keys)
     
-    df_clean.to_csv(output_path, index=False)
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] Results updated: {len(df_clean)} trades, Latest PnL: {df_clean['intraday_pnl'].iloc[-1]:.2f}")
+    logger.info("Results updated: %d trades, Latest PnL: %.2f", total_trades, df['intraday_pnl'].iloc[-1])
 
 def load_state(state_file):
     """Load the last processed row count"""
     if os.path.exists(state_file):
         try:
-            with open(state_file, 'rb') as f:
-                return pickle.load(f)
-        except:
+            with open(state_file) as f:
+                return int(f.read())
+        except (OSError, ValueError):
             return 0
     return 0
 
 def save_state(state_file, last_row):
-    """Save the last processed row count"""
+    """Save the last processed row count (write-then-rename so it is never half-written)"""
+    tmp_file = state_file + '.tmp'
     try:
-        with open(state_file, 'wb') as f:
-            pickle.dump(last_row, f)
+        with open(tmp_file, 'w') as f:
+            f.write(str(int(last_row)))
+        os.replace(tmp_file, state_file)
     except Exception as e:
         print(f"Warning: Could not save state: {e}")
 
@@ -153,67 +134,78 @@ def continuous_monitor(input_file, output_file, state_file, poll_interval=2):
     # Load last processed state
     last_processed_row = load_state(state_file)
     
+    # Parsed fills are cached between polls; matching trades accumulate incrementally
+    fills_reader = FillsTailReader(
+        input_file,
+        filters={'Exchange': 'CME', 'CurrentUser': 'Eric', 'Contract': 'ZN Sep25'},
+    )
+    all_filtered_df = pd.DataFrame()
+    
+    # Fills already in output_file; the first save rewrites it, later saves append
+    written_keys = set()
+    
     try:
         while True:
             try:
                 # Check if input file exists
                 if not os.path.exists(input_file):
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Waiting for input file: {input_file}")
+                    logger.info("Waiting for input file: %s", input_file)
                     time_module.sleep(poll_interval)
                     continue
                 
-                # Read the full CSV file
-                df_full = pd.read_csv(input_file)
+                # Parse only the rows appended since the last poll (no-op if the file is unchanged)
+                new_rows, reset = fills_reader.refresh()
+                if reset:
+                    # Reader started over (first poll or file was replaced)
+                    all_filtered_df = pd.DataFrame()
+                    written_keys.clear()
+                if new_rows is not None and not new_rows.empty:
+                    # Rows come back already filtered to CME / Eric / ZN Sep25
+                    new_rows = new_rows.assign(DateTime=pd.to_datetime(new_rows['Date'] + ' ' + new_rows['Time']))
+                    all_filtered_df = pd.concat([all_filtered_df, new_rows])
+                
+                total_rows = fills_reader.row_count
                 
                 # Check for new rows
-                if len(df_full) > last_processed_row:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Processing {len(df_full) - last_processed_row} new rows...")
-                    
-                    # Get ALL filtered data (to maintain proper context for PnL calculations)
-                    all_filtered_df = df_full[
-                        (df_full['Exchange'] == 'CME') & 
-                        (df_full['CurrentUser'] == 'Eric') & 
-                        (df_full['Contract'] == 'ZN Sep25')
-                    ].copy()
+                if total_rows > last_processed_row:
+                    logger.info("Processing %d new rows...", total_rows - last_processed_row)
                     
                     if not all_filtered_df.empty:
-                        # Convert datetime and create signed quantities
-                        all_filtered_df['DateTime'] = pd.to_datetime(all_filtered_df['Date'] + ' ' + all_filtered_df['Time'])
-                        all_filtered_df = create_signed_quantity(all_filtered_df)
-                        
                         # Calculate PnL for all matching trades
                         result_df = calculate_intraday_pnl(all_filtered_df)
                         
                         # Save results with duplicate prevention
-                        save_results(result_df, output_file)
+                        save_results(result_df, output_file, written_keys)
                         
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed {len(all_filtered_df)} total matching trades")
+                        logger.info("Processed %d total matching trades", len(all_filtered_df))
                     else:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] No matching trades found")
+                        logger.info("No matching trades found")
                     
                     # Update state regardless of whether we found matching trades
-                    last_processed_row = len(df_full)
+                    last_processed_row = total_rows
                     save_state(state_file, last_processed_row)
                 
                 # Wait before next check
                 time_module.sleep(poll_interval)
                 
             except KeyboardInterrupt:
-                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Stopping monitor...")
+                logger.info("Stopping monitor...")
                 break
             except Exception as e:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {e}")
+                logger.error("Error: %s", e)
                 time_module.sleep(poll_interval * 2)  # Wait longer on error
                 
     except KeyboardInterrupt:
-        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Monitor stopped by user")
+        logger.info("Monitor stopped by user")
 
 def main():
     """Main function to run the intraday PnL calculator"""
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s', datefmt='%H:%M:%S')
+    
     # File paths
     input_file = "data/output/ladder/continuous_fills.csv"
     output_file = "Optimizer/Sumo_Curve/intraday_pnl_results.csv"
-    state_file = "Optimizer/Sumo_Curve/intraday_pnl_state.pkl"
+    state_file = "Optimizer/Sumo_Curve/intraday_pnl.state"
     
     # Start continuous monitoring
     continuous_monitor(input_file, output_file, state_file, poll_interval=2)
@@ -12,9 +12,9 @@ in the Jupyter notebook.
 from typing import Dict, List, Tuple, Union
 import logging
 import numpy as np
+import orjson
 import sys
 import os
-import pandas as pd
 import time
 import csv
 
@@ -28,6 +28,8 @@ from Optimizer.risk_utils import (
     levels_crossed,
     TECH_LEVELS_DEC,
 )
+from Optimizer.Sumo_Curve.fills_reader import FillsTailReader
+from Optimizer.Sumo_Curve._risk_core import coeff_products, find_extreme_index
 
 logger = logging.getLogger(__name__)
 
@@ -90,8 +92,8 @@ def R_survival(
     nbm_high = cp_dec + NBM / 16.0
     nbm_low  = cp_dec - NBM / 16.0
 
-    lvls_above = levels_crossed(cp_dec, nbm_high, tech_levels_dec)
-    lvls_below = levels_crossed(cp_dec, nbm_low,  tech_levels_dec)
+    lvls_above = levels_crossed(cp_dec, nbm_high, tech_levels_dec).tolist()
+    lvls_below = levels_crossed(cp_dec, nbm_low,  tech_levels_dec).tolist()
 
     # Make sure *current price* is present at index 0 in both lists
     if not lvls_above or lvls_above[0] != cp_dec:
@@ -108,36 +110,24 @@ def R_survival(
     # ------------------------------------------------------------------
     # Pre-compute coefficient products for above & below directions
     # ------------------------------------------------------------------
-    d_above = np.diff(lvls_above)
-    d_below = np.diff(lvls_below)
-
-    coeff_above: List[float] = []
-    prod = d_above[0] if len(d_above) else 0.0
-    if prod:
-        coeff_above.append(prod)
-        for i in range(1, len(d_above)):
-            prod *= 1 + d_above[i] / (breakeven(lvls_above[i], cp_dec) / 16)
-            coeff_above.append(prod)
-
-    coeff_below: List[float] = []
-    prod = d_below[0] if len(d_below) else 0.0
-    if prod:
-        coeff_below.append(prod)
-        for i in range(1, len(d_below)):
-            prod *= 1 + d_below[i] / (breakeven(lvls_below[i], cp_dec) / 16)
-            coeff_below.append(prod)
+    # The kernels are compiled for float64 only
+    lvls_above_arr = np.asarray(lvls_above, dtype=np.float64)
+    lvls_below_arr = np.asarray(lvls_below, dtype=np.float64)
+    d_above = np.diff(lvls_above_arr)
+    d_below = np.diff(lvls_below_arr)
+
+    coeff_above = coeff_products(lvls_above_arr, d_above, float(cp_dec))
+    coeff_below = coeff_products(lvls_below_arr, d_below, float(cp_dec))
 
     # ------------------------------------------------------------------
     # Search how far we can go before stop_loss is violated
     # ------------------------------------------------------------------
     new_stop = stop_loss - pnl_0
 
-    def _find_extreme(risk: float, coeffs: List[float], levels: List[float]) -> Tuple[float, int]:
-        for idx, c in enumerate(coeffs):
-            if risk * c * 16 <= new_stop:
-                return levels[idx], idx
-        # if we exhaust the loop w/out triggering stop, we can survive all
-        return levels[len(coeffs)], len(coeffs)  # last level
+    def _find_extreme(risk: float, coeffs: np.ndarray, levels: List[float]) -> Tuple[float, int]:
+        idx = int(find_extreme_index(coeffs, float(risk), float(new_stop)))
+        # idx == len(coeffs) means we never hit the stop: survive to the last level
+        return levels[idx], idx
 
     if R0 > 0:  # long risk ⇒ danger is *below*
         extreme, idx = _find_extreme(R0, coeff_below, lvls_below)
@@ -169,7 +159,6 @@ def R_survival(
                  current_price, cp_dec, R0, extreme, ticks_to_extreme)
 
     risk_curve = {k: float(v) for k, v in risk_curve.items()}
-    print("Risk Curve: ", risk_curve)
     return risk_curve, extreme, ticks_to_extreme
 # ---------------------------------------------------------------------------
 # Streaming functionality
@@ -177,14 +166,11 @@ def R_survival(
 
 def calculate_net_position(fills_df) -> float:
     """Calculate net position from fills dataframe."""
-    net_position = 0.0
-    for _, row in fills_df.iterrows():
-        quantity = float(row['Quantity'])
-        if row['SideName'] == 'BUY':
-            net_position += quantity
-        elif row['SideName'] == 'SELL':
-            net_position -= quantity
-    return net_position
+    quantity = fills_df['Quantity'].to_numpy(dtype=np.float64)
+    side = fills_df['SideName'].to_numpy()
+    # +1 for BUY, -1 for SELL, 0 for anything else
+    sign = (side == 'BUY').astype(np.float64) - (side == 'SELL')
+    return float(np.dot(quantity, sign))
 
 
 def stream_r_survival(
@@ -208,95 +194,105 @@ def stream_r_survival(
     print(f"Output: {output_file}")
     print(f"Interval: {interval}s")
     
-    last_processed_count = 0
+    # Running signed quantity carried across polls so only new fills are touched
+    cumulative_quantity = 0.0
     
-    # Create output file with headers
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            'Date', 'Time', 'SideName', 'Quantity', 'Price', 'OrderId', 'Exchange', 
-            'Contract', 'CurrentUser', 'risk_curve', 'extreme_level', 'ticks_to_extreme'
-        ])
+    # Parsed fills are cached between polls; matching trades accumulate incrementally
+    fills_reader = FillsTailReader(input_file, usecols=[
+        'Date', 'Time', 'SideName', 'Quantity', 'Price', 'OrderId',
+        'Exchange', 'Contract', 'CurrentUser',
+    ], filters={'CurrentUser': 'Eric', 'Exchange': 'CME', 'Contract': 'ZN Sep25'})
     
-    while True:
-        try:
-            if not os.path.exists(input_file):
-                time.sleep(interval)
-                continue
-                
-            # Read the CSV file
-            df = pd.read_csv(input_file)
-            
-            # Filter for Eric, CME, ZN Jun25
-            mask = (df['CurrentUser'] == 'Eric') & (df['Exchange']=='CME') & (df['Contract'] == 'ZN Sep25')
-            filtered_df = df[mask].copy()
-
-            # Check if we have new data
-            current_count = len(filtered_df)
-            if current_count <= last_processed_count:
-                time.sleep(interval)
-                continue
-                
-            if filtered_df.empty:
-                time.sleep(interval)
-                continue
-            
-            # Create net_position column
-            filtered_df['signed_quantity'] = np.where(filtered_df['SideName'] == 'BUY', 
-                                                     filtered_df['Quantity'], 
-                                                     -filtered_df['Quantity'])
-            filtered_df['net_position'] = (62.5)*filtered_df['signed_quantity'].cumsum()
-            
-            # Process only new rows
-            new_rows = filtered_df.iloc[last_processed_count:]
-            
-            for idx, row in new_rows.iterrows():
-                net_position = row['net_position']
-                current_price = float(row['Price'])
-                
-                # Skip if position is flat
-                if net_position == 0:
+    # Create output file with headers; the handle stays open for the monitor's lifetime
+    out = open(output_file, 'w', newline='', buffering=1 << 20)
+    writer = csv.writer(out)
+    writer.writerow([
+        'Date', 'Time', 'SideName', 'Quantity', 'Price', 'OrderId', 'Exchange', 
+        'Contract', 'CurrentUser', 'risk_curve_json', 'extreme_level', 'ticks_to_extreme'
+    ])
+    out.flush()
+    
+    try:
+        while True:
+            try:
+                if not os.path.exists(input_file):
+                    time.sleep(interval)
+                    continue
+                    
+                # Parse only the rows appended since the last poll, filtered
+                # to Eric, CME, ZN Sep25 before they reach pandas
+                new_rows, reset = fills_reader.refresh()
+                if reset:
+                    # Reader started over (first poll or file was replaced)
+                    cumulative_quantity = 0.0
+                if new_rows is None or new_rows.empty:
+                    time.sleep(interval)
                     continue
                 
-                # Calculate R_survival
-                try:
-                    risk_curve, extreme_level, ticks_to_extreme = R_survival(
-                        current_price=current_price,
-                        R0=net_position
-                    )
+                # Net position continues from the previous poll's running total
+                quantity = new_rows['Quantity'].to_numpy(dtype=np.float64)
+                signed_quantity = np.where(new_rows['SideName'].to_numpy() == 'BUY', quantity, -quantity)
+                running_quantity = np.cumsum(np.concatenate(([cumulative_quantity], signed_quantity)))[1:]
+                cumulative_quantity = running_quantity[-1]
+                new_rows = new_rows.assign(net_position=(62.5)*running_quantity)
+                
+                batch_rows = []
+                for row in new_rows.itertuples(index=False):
+                    net_position = row.net_position
+                    current_price = float(row.Price)
+                    
+                    # Skip if position is flat
+                    if net_position == 0:
+                        continue
                     
-                    # Write result to output
-                    with open(output_file, 'a', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            row['Date'],
-                            row['Time'],
-                            row['SideName'],
-                            row['Quantity'],
-                            row['Price'],
-                            row['OrderId'],
-                            row['Exchange'],
-                            row['Contract'],
-                            row['CurrentUser'],
-                            str(risk_curve),
+                    # Calculate R_survival
+                    try:
+                        risk_curve, extreme_level, ticks_to_extreme = R_survival(
+                            current_price=current_price,
+                            R0=net_position
+                        )
+                        
+                        # Queue result for this poll's batch write
+                        batch_rows.append([
+                            row.Date,
+                            row.Time,
+                            row.SideName,
+                            row.Quantity,
+                            row.Price,
+                            row.OrderId,
+                            row.Exchange,
+                            row.Contract,
+                            row.CurrentUser,
+                            orjson.dumps(risk_curve, option=orjson.OPT_NON_STR_KEYS).decode(),
                             extreme_level,
                             ticks_to_extreme
                         ])
-                    
-                    print(f"[{row['Date']} {row['Time']}] R0={net_position:.1f}, Price={current_price}, "
-                          f"Extreme={extreme_level:.5f}, Ticks={ticks_to_extreme:.1f}")
-                    
-                except Exception as e:
-                    print(f"Error calculating R_survival: {e}")
-            
-            last_processed_count = current_count
-            
-        except Exception as e:
-            print(f"Error processing file: {e}")
-            
-        time.sleep(interval)
+                        
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("[%s %s] R0=%.1f, Price=%s, Extreme=%.5f, Ticks=%.1f",
+                                         row.Date, row.Time, net_position, current_price,
+                                         extreme_level, ticks_to_extreme)
+                        
+                    except Exception as e:
+                        print(f"Error calculating R_survival: {e}")
+                
+                # One write + flush per poll so readers of the output still see every batch
+                writer.writerows(batch_rows)
+                out.flush()
+                
+            except Exception as e:
+                print(f"Error processing file: {e}")
+                
+            time.sleep(interval)
+    finally:
+        out.close()
 
 
 if __name__ == "__main__":
+    # Per-row output is DEBUG; set R_SURVIVAL_LOG_LEVEL=DEBUG to see it
+    logging.basicConfig(
+        level=os.environ.get("R_SURVIVAL_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s",
+    )
     # Run the streaming monitor
     stream_r_survival() 
\ No newline at end of file
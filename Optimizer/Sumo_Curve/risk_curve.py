@@ -9,25 +9,16 @@ The code is a cleaned-up, script-ready extraction of the logic you developed
 in the Jupyter notebook.
 """
 
-from typing import Dict, List, Tuple, Union
 import logging
+import threading
 import numpy as np
-import sys
-import os
-import pandas as pd
-import time
-import csv
 
-# Add the workspace root to Python path
-workspace_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-sys.path.insert(0, workspace_root)
-
-from Optimizer.risk_utils import (
+from ..risk_utils import (
     zn_to_decimal,
     decimal_to_zn,  # noqa: F401 – exposed for convenience
-    levels_crossed,
-    TECH_LEVELS_DEC,
+    TECH_LEVELS_DEC,  # noqa: F401 – exposed for convenience
 )
+from ._risk_core import r_dict_ladder
 
 logger = logging.getLogger(__name__)
 
@@ -41,92 +32,118 @@ def breakeven(price, current_price):
         return 3
     
 
-def R_dict(current_price,  tech_levels_dec, stop_loss = -10000, NBM=25, pnl_0=0):
+class RiskCurveState:
     """
-    This function calculates the risk dictionary i.e. the risk for each NBM level above and below the current price.
+    Scratch buffers reused by R_dict from tick to tick.
+
+    The tech levels are static for a session, so everything that depends only
+    on them (the contiguous copy the kernel reads, the output capacity) is set
+    up once, either here or on the first tick that passes a new levels array.
+    The level/risk arrays returned by r_dict are views into these buffers and
+    are overwritten by the next call on the same state; copy them if they have
+    to outlive it. A state must not be shared between threads.
     """
 
-    # Convert the current price to a decimal if it is a string.
-    if isinstance(current_price, str):
-        current_price_dec = zn_to_decimal(current_price)
-    else:
-        current_price_dec = current_price
-    
-    # Calculate the NBM levels above and below the current price.
-    NBM_levels_above_dec = levels_crossed(current_price_dec, current_price_dec + NBM/16, tech_levels_dec)
-    NBM_levels_below_dec = levels_crossed(current_price_dec, current_price_dec - NBM/16, tech_levels_dec)
-
-    # levels_above are all the prices where we add some negative risk.
-    # If the current price itself is not a technical level, we add it to the list of levels_above since we are starting with a risk.
-    if NBM_levels_above_dec[0] == current_price_dec:
-        levels_above = NBM_levels_above_dec
-    else:
-        levels_above = [current_price_dec] + NBM_levels_above_dec
-    
-    # levels_below are all the prices where we add some positve risk.
-    # If the current price itself is not a technical level, we add it to the list of levels_below since we are starting with a risk.
-    if NBM_levels_below_dec[0] == current_price_dec:
-        levels_below = NBM_levels_below_dec
-    else:
-        levels_below = [current_price_dec] + NBM_levels_below_dec
-    
-    # Filter levels_above: ensure minimum distance of 16/3 between consecutive levels
-    while len(levels_above) > 1 and (levels_above[1] - levels_above[0]) < 3/16:
-        levels_above.pop(1)  # Remove the second element
-        
-    # Filter levels_below: ensure minimum distance of 16/3 between consecutive levels  
-    while len(levels_below) > 1 and (levels_below[0] - levels_below[1]) < 3/16:
-        levels_below.pop(1)  # Remove the second element
-
-
-    # Calculate the deltaL for the levels_above and levels_below.
-    deltaL_above = np.array(levels_above[1:]) - np.array(levels_above[:-1])
-    deltaL_below = np.array(levels_below[1:]) - np.array(levels_below[:-1])
-    
-    # Calculate the product coefficient for the levels_above and levels_below.
-    # coeff_above looks like the following: deltaL_above[0] * (1 + (deltaL_above[1] / breakeven(levels_above[0])) ) * (1 + (deltaL_above[2] / breakeven(levels_above[1])) ) * ...
-    prod = deltaL_above[0]
-    coeff_above = [prod]
-    for i in range(1, len(deltaL_above)):
-        prod = prod * (1 + (deltaL_above[i] / (breakeven(levels_above[i], current_price_dec)/16 ) ) ) # 3/16 is the pnl breakeven constant
-        coeff_above.append(prod)
-
-    prod = deltaL_below[0]
-    coeff_below = [prod]
-    for i in range(1, len(deltaL_below)):
-        prod = prod * (1 + (deltaL_below[i] / (breakeven(levels_below[i], current_price_dec)/16) ) ) # 3/16 is the pnl breakeven constant
-        coeff_below.append(prod)
-    
-    # coeff_above and coeff_below are in decimal form.
-
-    R0_above = (stop_loss / coeff_above[-1])/16 # 16 is the number of ticks in a basis point
-    R0_below = (stop_loss / coeff_below[-1])/16 # 16 is the number of ticks in a basis point
-
-    print("current_price_dec: ", current_price_dec)
-    print("levels_above: ", levels_above)
-    print("levels_below: ", levels_below)
-    print("R0_above: ", R0_above)
-    print("R0_below: ", R0_below)
-    print("coeff_above: ", coeff_above)
-    print("coeff_below: ", coeff_below)
-    print("deltaL_above: ", deltaL_above)
-    print("deltaL_below: ", deltaL_below)
-
-    print("Length of coeff_above: ", len(coeff_above))
-    print("Length of coeff_below: ", len(coeff_below))
-    print("Length of levels_above: ", len(levels_above))
-    print("Length of levels_below: ", len(levels_below))
-
-    # Initialize the risk dictionary.
-    R_dict_result = {current_price_dec: R0_above}
+    def __init__(self, tech_levels_dec=None, capacity=128):
+        self._levels = np.empty(capacity)
+        self._risks = np.empty(capacity, dtype=np.float32)
+        self._tech_levels_src = None
+        self._tech_levels = None
+        # One-slot memo: back-to-back ticks often repeat the same price
+        self._last_key = None
+        self._last_tech_levels = None
+        self._last_result = None
+        if tech_levels_dec is not None:
+            self._bind_tech_levels(tech_levels_dec)
+
+    def _bind_tech_levels(self, tech_levels_dec):
+        """Per-session setup: a writable, contiguous float64 copy of the levels and room for the ladder."""
+        self._tech_levels = np.array(tech_levels_dec, dtype=np.float64)
+        self._tech_levels_src = tech_levels_dec
+        if len(self._tech_levels) + 1 > self._levels.shape[0]:
+            self._levels = np.empty(len(self._tech_levels) + 1)
+            self._risks = np.empty(len(self._tech_levels) + 1, dtype=np.float32)
+
+    def r_dict(self, current_price,  tech_levels_dec, stop_loss = -10000, NBM=25, pnl_0=0):
+        """
+        This function calculates the risk for each NBM level above and below the current price.
+
+        Returns (levels, risks, R0_above, R0_below): two arrays sorted by
+        ascending level, with the current price carrying R0_above, so a price can
+        be looked up with np.searchsorted(levels, price). The arrays are
+        read-only; a call repeating the previous arguments returns the same
+        result without recomputing it.
+
+        levels are float64. risks are float32: they are computed in float64
+        and rounded on store, i.e. kept to ~7 significant digits, which is far
+        below the dollar resolution they are used at. R0_above / R0_below are
+        returned at full float64 precision.
+        """
+
+        # Convert the current price to a decimal if it is a string.
+        if isinstance(current_price, str):
+            current_price_dec = zn_to_decimal(current_price)
+        else:
+            current_price_dec = current_price
+
+        key = (current_price_dec, stop_loss, NBM)
+        if key == self._last_key and tech_levels_dec is self._last_tech_levels:
+            return self._last_result
+
+        if tech_levels_dec is not self._tech_levels_src:
+            self._bind_tech_levels(tech_levels_dec)
+
+        # Window, minimum-distance filter, breakevens and risks in one native call
+        n, R0_above, R0_below = r_dict_ladder(
+            self._tech_levels, float(current_price_dec), NBM/16, float(stop_loss), self._levels, self._risks,
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "current_price_dec=%s levels=%s risks=%s R0_above=%s R0_below=%s",
+                current_price_dec, self._levels[:n], self._risks[:n], R0_above, R0_below,
+            )
+
+        levels = self._levels[:n]
+        risks = self._risks[:n]
+        levels.setflags(write=False)
+        risks.setflags(write=False)
+
+        self._last_key = key
+        self._last_tech_levels = tech_levels_dec
+        self._last_result = (levels, risks, R0_above, R0_below)
+        return self._last_result
+
+
+_thread_state = threading.local()
 
-    for i in range(1, len(levels_above)):
-        R_dict_result[levels_above[i]] = R0_above * coeff_above[i-1]/(breakeven(levels_above[i], current_price_dec)/16)
 
-    for i in range(1, len(levels_below)):
-        R_dict_result[levels_below[i]] = R0_below * coeff_below[i-1]/(breakeven(levels_below[i], current_price_dec)/16)
+def R_dict(current_price,  tech_levels_dec, stop_loss = -10000, NBM=25, pnl_0=0):
+    """
+    RiskCurveState.r_dict on the calling thread's own state; the returned
+    arrays are only valid until that thread's next R_dict call.
+    """
+    state = getattr(_thread_state, 'state', None)
+    if state is None:
+        state = _thread_state.state = RiskCurveState()
+    return state.r_dict(current_price, tech_levels_dec, stop_loss, NBM, pnl_0)
 
-    return R_dict_result, R0_above, R0_below
 
+def R_dict_as_dict(current_price, tech_levels_dec, stop_loss=-10000, NBM=25, pnl_0=0):
+    """
+    R_dict in its original form: ({level: risk}, R0_above, R0_below), keyed
+    current price first, then the levels above (ascending) and below (descending).
+    """
+    levels_arr, risks_arr, R0_above, R0_below = R_dict(current_price, tech_levels_dec, stop_loss, NBM, pnl_0)
+
+    current_price_dec = zn_to_decimal(current_price) if isinstance(current_price, str) else current_price
+    i_cp = int(np.searchsorted(levels_arr, current_price_dec))
 
-print(R_dict("111'01", TECH_LEVELS_DEC))
\ No newline at end of file
+    levels = levels_arr.tolist()
+    R_dict_result = {current_price_dec: R0_above}
+    for i in range(i_cp + 1, len(levels)):
+        R_dict_result[levels[i]] = risks_arr[i]
+    for i in range(i_cp - 1, -1, -1):
+        R_dict_result[levels[i]] = risks_arr[i]
+
+    return R_dict_result, R0_above, R0_below
@@ -9,7 +9,9 @@ NumPy) so that it can be reused in environments where Pandas is not
 available.
 """
 
+from functools import lru_cache
 from typing import List
+import math
 import re
 import numpy as np
 
@@ -20,6 +22,8 @@ import numpy as np
 _TICK32: float = 1.0 / 32.0       # one 32nd = 0.03125
 _HALF32: float = 1.0 / 64.0       # "+"  = half-tick = 0.015625
 
+_ZN_RE = re.compile(r"\s*(\d+)[\-\' ]?(\d{2})(\+?)\s*")
+
 # CBOT 10-year T-Note technical levels that we want the strategy to respect.
 # Feel free to load this list from an external source (database, CSV, etc.).
 TECHNICAL_LEVELS: list[str] = [
@@ -32,23 +36,14 @@ TECHNICAL_LEVELS: list[str] = [
     "114'06", "114'12", "114'18", "114'23", "114'30",
 ]
 
-# Pre-compute the decimal representations once at import-time so that every
-# consumer of this module shares the same NumPy array instance (cheap).
-
-def _init_levels() -> None:
-    """Populate the global TECH_LEVELS_DEC array lazily."""
-    global TECH_LEVELS_DEC
-    if TECH_LEVELS_DEC[0] is None:  # un-initialised sentinel
-        TECH_LEVELS_DEC = np.array([zn_to_decimal(s) for s in TECHNICAL_LEVELS], dtype=float)
-
-
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def zn_to_decimal(s: str) -> float:
     """Convert CBOT price strings (e.g. "111-04+" or "110'18+") to decimals."""
-    m = re.fullmatch(r"\s*(\d+)[\-\' ]?(\d{2})(\+?)\s*", s)
+    m = _ZN_RE.fullmatch(s)
     if not m:
         raise ValueError(f"Can't parse ZN price '{s}'")
     pts = int(m.group(1))           # whole points
@@ -56,32 +51,42 @@ def zn_to_decimal(s: str) -> float:
     half = 1 if m.group(3) else 0   # "+": adds one half-tick
     return pts + frac * _TICK32 + half * _HALF32
 
-TECH_LEVELS_DEC: np.ndarray = np.array([zn_to_decimal(s) for s in TECHNICAL_LEVELS], dtype=float)
+# Pre-compute the decimal representations once at import-time so that every
+# consumer of this module shares the same (read-only) NumPy array instance.
+# All levels are written as "PTS'FF[+]", so they are split in bulk rather than
+# run through the regex one by one.
+_pts, _, _rest = np.char.partition(np.array(TECHNICAL_LEVELS), "'").T
+_has_plus = np.char.endswith(_rest, "+")
+_frac = np.char.rstrip(_rest, "+").astype(np.int64)
+TECH_LEVELS_DEC: np.ndarray = _pts.astype(np.int64) + _frac * _TICK32 + _has_plus * _HALF32
+del _pts, _, _rest, _has_plus, _frac
+TECH_LEVELS_DEC.setflags(write=False)
+# levels_crossed bisects into the levels, so they have to stay sorted.
+assert np.all(np.diff(TECH_LEVELS_DEC) >= 0), "TECHNICAL_LEVELS must be in ascending order"
 
 
 def decimal_to_zn(x: float) -> str:
     """Convert decimal prices back to the CBOT 32nds string format."""
-    pts = int(x)
-    # Multiply by 32 **before** taking int to avoid FP rounding surprises
-    remainder = round((x - pts) * 32, 3)  # keep three decimals, good enough
-    frac = int(remainder)
-    half = 1 if (remainder - frac) >= 0.5 else 0
+    # Whole half-ticks, truncated like the quoted price; the small epsilon
+    # absorbs FP error just below a half-tick boundary
+    t = math.floor(x * 64.0 + 1e-3)
+    pts, r = divmod(t, 64)
+    frac, half = divmod(r, 2)
     return f"{pts}'{frac:02d}{'+' if half else ''}"
 
 
-def levels_crossed(p0: float, p1: float, levels: np.ndarray | List[float]) -> List[float]:
+def levels_crossed(p0: float, p1: float, levels: np.ndarray | List[float]) -> np.ndarray:
     """Return the technical levels *strictly* between p0 and p1, inclusive.
 
-    The order of the returned list reflects the direction of travel: if p1 > p0
-    the list is ascending, otherwise descending.  This is useful when you want
-    to replay the path chronologically.
+    ``levels`` must be sorted ascending (TECH_LEVELS_DEC is); the range is
+    located by binary search and returned as a view into it. The order of the
+    returned array reflects the direction of travel: if p1 > p0 it is
+    ascending, otherwise descending.  This is useful when you want to replay
+    the path chronologically.
     """
     lvls = np.asarray(levels)
-    lo, hi = sorted((p0, p1))
-    crossed = lvls[(lvls >= lo) & (lvls <= hi)]
-    return crossed.tolist() if p1 > p0 else crossed[::-1].tolist()
-
-print(TECH_LEVELS_DEC)
-# Ensure TECH_LEVELS_DEC is available as soon as the module is imported
-_init_levels() 
-print(TECH_LEVELS_DEC)
\ No newline at end of file
+    lo, hi = (p0, p1) if p0 <= p1 else (p1, p0)
+    i = np.searchsorted(lvls, lo, side='left')
+    j = np.searchsorted(lvls, hi, side='right')
+    crossed = lvls[i:j]
+    return crossed if p1 > p0 else crossed[::-1]
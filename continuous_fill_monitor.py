@@ -8,13 +8,21 @@ Continuously downloads filled orders and maintains them in CSV format.
 import os
 import sys
 import csv
+import io
 import json
 import time
+import queue
+import operator
 import signal
+import socket
 import logging
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import threading
-import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from threading import Thread, Lock, Event
 import argparse
@@ -38,6 +46,60 @@ TT_API_BASE_URL = "https://ttrestapi.trade.tt"
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "data", "output", "ladder")
 DEFAULT_POLL_INTERVAL = 60  # seconds between checks
 DEFAULT_MAX_RETRIES = 5
+MAX_POLL_INTERVAL = 600  # seconds; cap for the back-off while no new fills arrive
+LOOKUP_WORKERS = 20  # concurrent instrument/user/market lookups per batch
+FILL_QUEUE_SIZE = 16  # fetched batches waiting for the CSV writer thread
+TAIL_SCAN_BYTES = 64 * 1024  # end of the CSV scanned for the latest fill timestamp
+LOOKUP_CACHE_SIZE = 4096  # entries kept per lookup cache before the least recently used is evicted
+TIMESTAMP_BUCKET_SECONDS = 900  # fill timestamps are formatted from a cached local time per quarter hour
+TIMESTAMP_BUCKET_CACHE_SIZE = 4096  # quarter-hour buckets kept (~6 weeks) before the cache is reset
+
+class LookupCache:
+    """Bounded, thread-safe LRU mapping for the REST lookup results.
+
+    The lookup pool reads and fills these caches from several threads, so
+    every operation holds the cache's lock; the critical sections are a
+    few dict operations, so a single lock per cache is not contended.
+    """
+
+    def __init__(self, maxsize=LOOKUP_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def setdefault(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._store(key, value)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._store(key, value)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def _store(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
 
 # Global state
 stop_event = Event()
@@ -46,7 +108,67 @@ logger = logging.getLogger(__name__)
 
 # Global caches for performance
 market_enums_cache = {}
-user_info_cache = {}
+user_info_cache = LookupCache()
+instrument_name_cache = LookupCache()
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets have TCP keep-alive on as well as TCP_NODELAY.
+
+    urllib3 already disables Nagle (TCP_NODELAY) by default; SO_KEEPALIVE lets
+    the OS notice pooled connections that died while the monitor was idle.
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        return super().init_poolmanager(*args, **kwargs)
+
+def create_http_session():
+    """Create a keep-alive session so REST calls reuse pooled TCP/TLS connections."""
+    session = requests.Session()
+    adapter = KeepAliveAdapter(pool_connections=20, pool_maxsize=50)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Shared by the lookup helpers and FillMonitor
+http_session = create_http_session()
+
+# Request headers for the current token, rebuilt only when the token is due for refresh
+auth_headers_cache = {'token_manager': None, 'headers': None, 'valid_until': 0.0}
+auth_headers_lock = Lock()
+
+def get_auth_headers(token_manager):
+    """Return the TT request headers, calling get_token() only once per token lifetime.
+
+    The headers are reused until the token manager's refresh point
+    (expiry_time minus refresh_buffer_seconds), tracked on the monotonic
+    clock. The returned dict is shared, so callers must not modify it.
+    """
+    with auth_headers_lock:
+        cached = auth_headers_cache
+        if cached['token_manager'] is token_manager and time.monotonic() < cached['valid_until']:
+            return cached['headers']
+
+        headers = {
+            "x-api-key": token_manager.api_key,
+            "accept": "application/json",
+            "Authorization": f"Bearer {token_manager.get_token()}"
+        }
+
+        valid_until = 0.0
+        expiry_time = getattr(token_manager, 'expiry_time', None)
+        if expiry_time is not None:
+            seconds_left = (expiry_time - datetime.now()).total_seconds() - token_manager.refresh_buffer_seconds
+            valid_until = time.monotonic() + seconds_left
+
+        cached['token_manager'] = token_manager
+        cached['headers'] = headers
+        cached['valid_until'] = valid_until
+        return headers
 
 def setup_logging(log_to_file=True, log_to_console=True):
     """Setup logging configuration."""
@@ -80,52 +202,77 @@ def signal_handler(signum, frame):
     logger.info(f"Received signal {signum}, shutting down gracefully...")
     stop_event.set()
 
+# Local date/hour/minute at the start of each 15-minute bucket (epoch seconds // 900).
+# UTC offsets and DST switches fall on quarter-hour boundaries, so the wall clock
+# within a bucket is its start plus the elapsed seconds.
+timestamp_bucket_cache = {}
+
 def convert_tt_timestamp_to_readable(timestamp_ns):
     """Convert TT nanosecond timestamp to readable format."""
     if not timestamp_ns:
         return None, None
     
     try:
-        # Convert nanoseconds to seconds
-        seconds = int(timestamp_ns) // 1_000_000_000
-        # Get milliseconds from remaining nanoseconds
-        milliseconds = (int(timestamp_ns) % 1_000_000_000) // 1_000_000
+        # Split nanoseconds into seconds and milliseconds
+        seconds, nanos = divmod(int(timestamp_ns), 1_000_000_000)
+        milliseconds = nanos // 1_000_000
         
-        # Create datetime object
-        dt = datetime.fromtimestamp(seconds)
+        # Only the first timestamp of a bucket goes through datetime/strftime
+        bucket, elapsed = divmod(seconds, TIMESTAMP_BUCKET_SECONDS)
+        cached = timestamp_bucket_cache.get(bucket)
+        if cached is None:
+            if len(timestamp_bucket_cache) >= TIMESTAMP_BUCKET_CACHE_SIZE:
+                timestamp_bucket_cache.clear()
+            dt = datetime.fromtimestamp(bucket * TIMESTAMP_BUCKET_SECONDS)
+            cached = (dt.strftime('%Y-%m-%d'), dt.hour, dt.minute)
+            timestamp_bucket_cache[bucket] = cached
+        date_str, hour, start_minute = cached
         
-        # Format date and time
-        date_str = dt.strftime('%Y-%m-%d')
-        time_str = dt.strftime('%H:%M:%S') + f'.{milliseconds:03d}'
+        # Format time of day with integer arithmetic
+        minute, second = divmod(elapsed, 60)
+        time_str = f'{hour:02d}:{start_minute + minute:02d}:{second:02d}.{milliseconds:03d}'
         
         return date_str, time_str
     except (ValueError, TypeError):
         return None, None
 
-def get_instrument_name(instrument_id, token_manager, cache={}):
+def fill_key(exec_id, order_id, timestamp, quantity, price):
+    """Duplicate-check key for a fill, from the text written to its CSV columns.
+
+    TT's execID identifies a fill when it is sent. It is often empty, and
+    then one order can have several fills at the same timestamp (a sweep
+    across price levels), told apart by quantity and price.
+    """
+    if exec_id:
+        return (exec_id, timestamp)
+    return (order_id, timestamp, quantity, price)
+
+def csv_field_text(value):
+    """A fill field as csv.writer writes it."""
+    return '' if value is None else str(value)
+
+def get_instrument_name(instrument_id, token_manager):
     """Get instrument name from ID with caching."""
-    if instrument_id in cache:
-        return cache[instrument_id]
+    name = instrument_name_cache.get(instrument_id)
+    if name is not None:
+        return name
     
     try:
         url = f"{TT_API_BASE_URL}/ttpds/{token_manager.env_path_segment}/instrument/{instrument_id}"
-        headers = {
-            "x-api-key": token_manager.api_key,
-            "accept": "application/json",
-            "Authorization": f"Bearer {token_manager.get_token()}"
-        }
+        headers = get_auth_headers(token_manager)
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_session.get(url, headers=headers, timeout=10)
         if response.status_code == 200:
             data = response.json()
             name = data.get('instrument', [{}])[0].get('alias', f'Unknown_{instrument_id}')
-            cache[instrument_id] = name
+            instrument_name_cache[instrument_id] = name
             return name
     except Exception as e:
         logger.warning(f"Failed to get instrument name for {instrument_id}: {e}")
     
-    cache[instrument_id] = f'Unknown_{instrument_id}'
-    return cache[instrument_id]
+    name = f'Unknown_{instrument_id}'
+    instrument_name_cache[instrument_id] = name
+    return name
 
 def get_market_enums(token_manager):
     """Get market enums with caching."""
@@ -138,14 +285,10 @@ def get_market_enums(token_manager):
         # Get market names
         markets_url = f"{TT_API_BASE_URL}/ttpds/{token_manager.env_path_segment}/markets"
         request_id = token_manager.create_request_id()
-        headers = {
-            "x-api-key": token_manager.api_key,
-            "accept": "application/json",
-            "Authorization": f"Bearer {token_manager.get_token()}"
-        }
+        headers = get_auth_headers(token_manager)
         params = {"requestId": request_id}
         
-        response = requests.get(markets_url, headers=headers, params=params, timeout=10)
+        response = http_session.get(markets_url, headers=headers, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             market_enums_cache['markets'] = {str(info['id']): info['name'] for info in data.get('markets', [])}
@@ -161,24 +304,20 @@ def get_user_info(user_id, token_manager):
     """Get user info with caching."""
     global user_info_cache
     
-    if user_id in user_info_cache:
-        return user_info_cache[user_id]
+    user_info = user_info_cache.get(user_id)
+    if user_info is not None:
+        return user_info
     
     if not user_id or user_id == 0:
-        user_info_cache[user_id] = {'alias': '', 'company': {'name': ''}}
-        return user_info_cache[user_id]
+        return user_info_cache.setdefault(user_id, {'alias': '', 'company': {'name': ''}})
     
     try:
         url = f"{TT_API_BASE_URL}/ttuser/{token_manager.env_path_segment}/user/{user_id}"
         request_id = token_manager.create_request_id()
-        headers = {
-            "x-api-key": token_manager.api_key,
-            "accept": "application/json",
-            "Authorization": f"Bearer {token_manager.get_token()}"
-        }
+        headers = get_auth_headers(token_manager)
         params = {"requestId": request_id}
         
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = http_session.get(url, headers=headers, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             user_data = data.get('user', [{}])[0]
@@ -188,32 +327,12 @@ def get_user_info(user_id, token_manager):
         logger.warning(f"Failed to get user info for {user_id}: {e}")
     
     # Fallback data
-    user_info_cache[user_id] = {
+    user_info = {
         'alias': f'user_id:{user_id}',
         'company': {'name': f'user_id:{user_id}'}
     }
-    return user_info_cache[user_id]
-
-def get_contract_name(instrument_id, token_manager):
-    """Get contract name (alias) from instrument ID."""
-    try:
-        url = f"{TT_API_BASE_URL}/ttpds/{token_manager.env_path_segment}/instrument/{instrument_id}"
-        request_id = token_manager.create_request_id()
-        headers = {
-            "x-api-key": token_manager.api_key,
-            "accept": "application/json",
-            "Authorization": f"Bearer {token_manager.get_token()}"
-        }
-        params = {"requestId": request_id}
-        
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('instrument', [{}])[0].get('alias', f'Unknown_{instrument_id}')
-    except Exception as e:
-        logger.warning(f"Failed to get contract name for {instrument_id}: {e}")
-    
-    return f'Unknown_{instrument_id}'
+    user_info_cache[user_id] = user_info
+    return user_info
 
 class FillMonitor:
     """Main class for monitoring and processing fills."""
@@ -223,14 +342,27 @@ class FillMonitor:
         self.max_retries = max_retries
         self.token_manager = None
         self.last_timestamp = None
+        self.current_interval = poll_interval
         self.csv_file = output_file or os.path.join(OUTPUT_DIR, "continuous_fills.csv")
         self.csv_lock = Lock()
+        self.lookup_pool = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS, thread_name_prefix="tt-lookup")
         
         # Ensure output directory exists
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         
         # Initialize CSV file with headers
         self.init_csv_file()
+
+        # Keys of the fills already on disk, kept up to date as rows are appended
+        self.seen_fills = self.load_seen_fill_keys()
+
+        # One O_APPEND descriptor for the monitor's lifetime
+        self.csv_fd = os.open(self.csv_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+
+        # Fetched batches are formatted, written and synced on a writer thread,
+        # so the next poll overlaps with the disk work of the previous one
+        self.fill_queue = queue.Queue(maxsize=FILL_QUEUE_SIZE)
+        self.writer_thread = Thread(target=self.writer_loop, name="csv-writer", daemon=True)
         
     def init_csv_file(self):
         """Initialize CSV file with headers."""
@@ -250,20 +382,20 @@ class FillMonitor:
         else:
             # Check if existing file has new columns, if not, we need to update it
             try:
-                df = pd.read_csv(self.csv_file, nrows=1)
-                existing_columns = df.columns.tolist()
+                # Only the header is needed to decide whether the file must be migrated
+                with open(self.csv_file, 'r', newline='', encoding='utf-8') as f:
+                    existing_columns = next(csv.reader(f), [])
                 if not all(col in existing_columns for col in ['Exchange', 'Contract', 'Originator', 'CurrentUser']):
                     logger.info("Updating existing CSV file with new columns...")
-                    # Read existing data
-                    df_full = pd.read_csv(self.csv_file)
-                    # Add missing columns with empty values
-                    for col in ['Exchange', 'Contract', 'Originator', 'CurrentUser']:
-                        if col not in df_full.columns:
-                            df_full[col] = ''
-                    # Reorder columns to match new header order
-                    df_full = df_full[headers]
-                    # Write back to file
-                    df_full.to_csv(self.csv_file, index=False)
+                    # Stream the rows into a new file in the new header order,
+                    # leaving missing columns empty, then swap it in
+                    tmp_file = self.csv_file + '.tmp'
+                    with open(self.csv_file, 'r', newline='', encoding='utf-8') as src, \
+                            open(tmp_file, 'w', newline='', encoding='utf-8') as dst:
+                        writer = csv.DictWriter(dst, fieldnames=headers, restval='', extrasaction='ignore')
+                        writer.writeheader()
+                        writer.writerows(csv.DictReader(src))
+                    os.replace(tmp_file, self.csv_file)
                     logger.info("Successfully updated CSV file with new columns")
             except Exception as e:
                 logger.warning(f"Could not update existing CSV file: {e}")
@@ -287,6 +419,9 @@ class FillMonitor:
                 raise Exception("Failed to acquire initial token")
                 
             logger.info("Token manager initialized successfully")
+
+            # Fill the lookup caches off the poll loop so the first batch mostly hits them
+            Thread(target=self.warm_caches, name="cache-warm", daemon=True).start()
             return True
             
         except Exception as e:
@@ -294,7 +429,12 @@ class FillMonitor:
             return False
     
     def fetch_fills(self, min_timestamp=None):
-        """Fetch fills from TT API."""
+        """Fetch fills from TT API.
+
+        The TT REST ledger only serves fills on request (no push, stream or
+        long-poll option), so the monitor polls with minTimestamp set to the
+        last fill seen and backs off while the account is idle.
+        """
         try:
             # Build API request
             service = "ttledger"
@@ -310,20 +450,16 @@ class FillMonitor:
                 params["minTimestamp"] = min_timestamp
                 logger.debug(f"Fetching fills from timestamp: {min_timestamp}")
             
-            headers = {
-                "x-api-key": self.token_manager.api_key,
-                "accept": "application/json",
-                "Authorization": f"Bearer {self.token_manager.get_token()}"
-            }
+            headers = get_auth_headers(self.token_manager)
             
             logger.debug(f"Making API request to: {url}")
             
             # Make the API request
-            response = requests.get(url, headers=headers, params=params, timeout=30)    
+            response = http_session.get(url, headers=headers, params=params, timeout=30)    
             response.raise_for_status()
             
-            # Parse response
-            api_response = response.json()
+            # Parse response (orjson decodes the raw bytes in C, several times faster than response.json())
+            api_response = orjson.loads(response.content)
             fills_data = api_response.get('fills', [])
             
             # Handle case where response is directly a list
@@ -340,15 +476,76 @@ class FillMonitor:
             logger.error(f"Unexpected error fetching fills: {e}")
             return None
     
-    def process_fill(self, fill_data):
-        """Process a single fill and return formatted data."""
+    def warm_caches(self):
+        """Pre-populate the lookup caches in the background.
+
+        Loads the market enums and seeds instrument names from the
+        InstrumentId/InstrumentName pairs already in the CSV. The TT REST API
+        has no bulk user listing, so users are still resolved on first use.
+        """
         try:
+            get_market_enums(self.token_manager)
+
+            known_names = {}
+            with open(self.csv_file, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if 'InstrumentId' in header and 'InstrumentName' in header:
+                    id_col = header.index('InstrumentId')
+                    name_col = header.index('InstrumentName')
+                    for row in reader:
+                        if len(row) > max(id_col, name_col) and row[name_col] and not row[name_col].startswith('Unknown_'):
+                            try:
+                                known_names[int(row[id_col])] = row[name_col]
+                            except ValueError:
+                                continue
+
+            for instrument_id, name in known_names.items():
+                instrument_name_cache.setdefault(instrument_id, name)
+            logger.info(f"Pre-loaded {len(known_names)} instrument names from CSV")
+
+        except Exception as e:
+            logger.warning(f"Could not pre-load lookup caches: {e}")
+
+    def resolve_lookups(self, fills_data):
+        """Build the per-batch lookup tables used by process_fill.
+
+        Each distinct instrument, user and market in the batch is resolved once
+        here instead of once per fill.
+        """
+        instrument_ids = {fill.get('instrumentId') for fill in fills_data}
+        user_ids = set()
+        for fill in fills_data:
+            for user_id in (fill.get('userId'), fill.get('currUserId')):
+                if user_id and user_id != 0:
+                    user_ids.add(user_id)
+
+        markets = {}
+        if any(fill.get('marketId') for fill in fills_data):
+            markets = get_market_enums(self.token_manager).get('markets', {})
+
+        return {
+            'instruments': {i: get_instrument_name(i, self.token_manager) for i in instrument_ids},
+            'users': {u: get_user_info(u, self.token_manager).get('alias', '') for u in user_ids},
+            'markets': markets,
+        }
+
+    def process_fill(self, fill_data, lookups=None):
+        """Process a single fill and return formatted data.
+
+        ``lookups`` comes from resolve_lookups; it is built for this fill alone
+        when not given.
+        """
+        try:
+            if lookups is None:
+                lookups = self.resolve_lookups([fill_data])
+
             # Extract basic data
             timestamp = fill_data.get('timeStamp')
             date_str, time_str = convert_tt_timestamp_to_readable(timestamp)
             
             instrument_id = fill_data.get('instrumentId')
-            instrument_name = get_instrument_name(instrument_id, self.token_manager)
+            instrument_name = lookups['instruments'][instrument_id]
             
             side = fill_data.get('side')
             side_name = 'BUY' if side == 1 else 'SELL' if side == 2 else 'UNKNOWN'
@@ -356,27 +553,18 @@ class FillMonitor:
             # Get additional information
             # Exchange - from market ID
             market_id = fill_data.get('marketId')
-            exchange = ''
-            if market_id:
-                enums = get_market_enums(self.token_manager)
-                exchange = enums.get('markets', {}).get(str(market_id), '')
+            exchange = lookups['markets'].get(str(market_id), '') if market_id else ''
             
-            # Contract - from instrument alias
-            contract = get_contract_name(instrument_id, self.token_manager) if instrument_id else ''
+            # Contract - the instrument alias, which is what the instrument name already holds
+            contract = instrument_name if instrument_id else ''
             
             # Originator - from user ID
             user_id = fill_data.get('userId')
-            originator = ''
-            if user_id and user_id != 0:
-                user_info = get_user_info(user_id, self.token_manager)
-                originator = user_info.get('alias', '')
+            originator = lookups['users'][user_id] if user_id and user_id != 0 else ''
             
             # Current User - from current user ID
             curr_user_id = fill_data.get('currUserId')
-            current_user = ''
-            if curr_user_id and curr_user_id != 0:
-                curr_user_info = get_user_info(curr_user_id, self.token_manager)
-                current_user = curr_user_info.get('alias', '')
+            current_user = lookups['users'][curr_user_id] if curr_user_id and curr_user_id != 0 else ''
             
             # Format the row
             row = [
@@ -407,24 +595,49 @@ class FillMonitor:
             logger.error(f"Error processing fill: {e}")
             return None
     
-    def get_existing_row_hashes(self):
-        """Get hashes of existing rows for efficient duplicate checking."""
-        existing_hashes = set()
-        
+    def prefetch_lookups(self, fills_data):
+        """Resolve the distinct instrument/user/market lookups of a batch concurrently.
+
+        Fills the module caches up front so process_fill only does cache hits
+        instead of one blocking REST round trip after another.
+        """
+        instrument_ids = {fill.get('instrumentId') for fill in fills_data}
+        user_ids = set()
+        for fill in fills_data:
+            for user_id in (fill.get('userId'), fill.get('currUserId')):
+                if user_id and user_id not in user_info_cache:
+                    user_ids.add(user_id)
+        need_markets = not market_enums_cache and any(fill.get('marketId') for fill in fills_data)
+
+        tasks = [self.lookup_pool.submit(get_instrument_name, instrument_id, self.token_manager)
+                 for instrument_id in instrument_ids]
+        tasks += [self.lookup_pool.submit(get_user_info, user_id, self.token_manager) for user_id in user_ids]
+        if need_markets:
+            tasks.append(self.lookup_pool.submit(get_market_enums, self.token_manager))
+        for task in tasks:
+            task.result()
+
+    def load_seen_fill_keys(self):
+        """Read the fill_key of every row already in the CSV, once."""
+        seen = set()
+
         try:
             if os.path.exists(self.csv_file):
                 with open(self.csv_file, 'r', newline='', encoding='utf-8') as f:
                     reader = csv.reader(f)
-                    next(reader, None)  # Skip header
-                    
-                    for row in reader:
-                        row_hash = hash(tuple(str(item) for item in row))
-                        existing_hashes.add(row_hash)
-        
+                    header = next(reader, None)
+                    key_columns = ('ExecId', 'OrderId', 'TimeStamp', 'Quantity', 'Price')
+                    if header and all(name in header for name in key_columns):
+                        cols = [header.index(name) for name in key_columns]
+                        last_col = max(cols)
+                        for row in reader:
+                            if len(row) > last_col:
+                                seen.add(fill_key(*(row[col] for col in cols)))
+
         except Exception as e:
             logger.warning(f"Could not read existing rows for duplicate checking: {e}")
-        
-        return existing_hashes
+
+        return seen
 
     def save_fills_to_csv(self, fills_data):
         """Save fills data to CSV file with duplicate prevention."""
@@ -432,29 +645,43 @@ class FillMonitor:
             return 0
         
         try:
+            # Keyed (see fill_key) on the strings written to the CSV, so
+            # already-written fills are dropped before any lookup or formatting
+            new_fills = {}
+            for fill in fills_data:
+                key = fill_key(
+                    csv_field_text(fill.get('execID', '')),
+                    csv_field_text(fill.get('orderId', '')),
+                    csv_field_text(fill.get('timeStamp') or ''),
+                    csv_field_text(fill.get('lastQty', '')),
+                    csv_field_text(fill.get('lastPx', '')),
+                )
+                if key not in self.seen_fills and key not in new_fills:
+                    new_fills[key] = fill
+            if not new_fills:
+                logger.info("Saved 0 new unique fills to CSV")
+                return 0
+
+            self.prefetch_lookups(new_fills.values())
+            lookups = self.resolve_lookups(new_fills.values())
+
             with self.csv_lock:
-                # Get existing row hashes for duplicate checking
-                existing_row_hashes = self.get_existing_row_hashes()
-                
-                with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    
-                    saved_count = 0
-                    for fill in fills_data:
-                        row = self.process_fill(fill)
-                        if row:
-                            # Create a hash of the row for comparison
-                            row_hash = hash(tuple(str(item) for item in row))
-                            
-                            # Check if this exact row already exists
-                            if row_hash not in existing_row_hashes:
-                                writer.writerow(row)
-                                existing_row_hashes.add(row_hash)  # Add to set to prevent duplicates in this batch
-                                saved_count += 1
-                    
-                    # Force write to disk
-                    f.flush()
-                    os.fsync(f.fileno())
+                rows = []
+                for key, fill in new_fills.items():
+                    row = self.process_fill(fill, lookups)
+                    if row:
+                        rows.append(row)
+                        self.seen_fills.add(key)
+
+                # Format the whole batch in memory and append it with a single write
+                buffer = io.StringIO(newline='')
+                csv.writer(buffer).writerows(rows)
+                self.append_to_csv(buffer.getvalue().encode('utf-8'))
+                saved_count = len(rows)
+
+                # Force write to disk
+                if saved_count:
+                    os.fsync(self.csv_fd)
             
             logger.info(f"Saved {saved_count} new unique fills to CSV")
             return saved_count
@@ -463,25 +690,82 @@ class FillMonitor:
             logger.error(f"Error saving to CSV: {e}")
             return 0
     
+    def append_to_csv(self, data):
+        """Append encoded rows to the CSV, retrying until a short write is complete."""
+        view = memoryview(data)
+        while view:
+            written = os.write(self.csv_fd, view)
+            view = view[written:]
+
+    def writer_loop(self):
+        """Save queued batches until the None sentinel arrives."""
+        while True:
+            fills_data = self.fill_queue.get()
+            if fills_data is None:
+                return
+            saved_count = self.save_fills_to_csv(fills_data)
+            logger.info(f"Processed {saved_count} new fills. Latest timestamp: {fills_data[-1].get('timeStamp')}")
+
+    def stop_writer(self):
+        """Let the writer thread drain the queue, then wait for it to exit."""
+        if self.writer_thread.is_alive():
+            self.fill_queue.put(None)
+            self.writer_thread.join()
+
+    def close_csv(self):
+        """Sync and close the CSV append descriptor."""
+        with self.csv_lock:
+            if self.csv_fd is None:
+                return
+            try:
+                os.fsync(self.csv_fd)
+            except OSError as e:
+                logger.error(f"Error syncing CSV to disk: {e}")
+            finally:
+                os.close(self.csv_fd)
+                self.csv_fd = None
+
     def get_latest_timestamp_from_csv(self):
-        """Get the latest timestamp from existing CSV to avoid duplicates."""
+        """Get the latest timestamp from existing CSV to avoid duplicates.
+
+        Rows are appended in timestamp order, so only the last
+        TAIL_SCAN_BYTES of the file are parsed rather than the whole CSV.
+        """
         try:
             if not os.path.exists(self.csv_file):
                 return None
-            
-            # Read the CSV and find the latest timestamp
-            df = pd.read_csv(self.csv_file)
-            if 'TimeStamp' in df.columns and not df.empty:
-                # Filter out empty timestamps and get the maximum
-                timestamps = df['TimeStamp'].dropna()
-                if not timestamps.empty:
-                    return int(max(timestamps))
-            
+
+            with open(self.csv_file, 'rb') as f:
+                header = next(csv.reader([f.readline().decode('utf-8')]), [])
+                if 'TimeStamp' not in header:
+                    return None
+                ts_col = header.index('TimeStamp')
+
+                header_end = f.tell()
+                size = f.seek(0, os.SEEK_END)
+                start = max(header_end, size - TAIL_SCAN_BYTES)
+                f.seek(start)
+                lines = f.read().decode('utf-8', errors='replace').splitlines()
+
+            if start > header_end:
+                lines = lines[1:]  # First line is most likely cut off by the seek
+
+            latest = None
+            for row in csv.reader(lines):
+                if len(row) > ts_col and row[ts_col]:
+                    try:
+                        ts = int(row[ts_col])
+                    except ValueError:
+                        continue
+                    if latest is None or ts > latest:
+                        latest = ts
+            return latest
+
         except Exception as e:
             logger.warning(f"Could not read latest timestamp from CSV: {e}")
-        
+
         return None
-    
+
     def run(self):
         """Main monitoring loop."""
         logger.info("Starting Fill Monitor...")
@@ -489,6 +773,7 @@ class FillMonitor:
         # Setup token manager
         if not self.setup_token_manager():
             logger.error("Failed to setup token manager, exiting")
+            self.close_csv()
             return
         
         # Get starting timestamp to avoid duplicates
@@ -498,6 +783,7 @@ class FillMonitor:
                 logger.info(f"Resuming from timestamp: {self.last_timestamp}")
         
         consecutive_errors = 0
+        self.writer_thread.start()
         
         while not stop_event.is_set():
             try:
@@ -513,38 +799,47 @@ class FillMonitor:
                         break
                     
                     logger.warning(f"API error #{consecutive_errors}, retrying in {self.poll_interval} seconds")
-                    time.sleep(self.poll_interval)
+                    if stop_event.wait(self.poll_interval):
+                        break
                     continue
                 
                 # Reset error counter on success
                 consecutive_errors = 0
                 
                 if fills:
-                    # Sort fills by timestamp to ensure chronological order
-                    fills.sort(key=lambda x: int(x.get('timeStamp', 0)))
+                    # Parse each timestamp once, then sort to ensure chronological order
+                    timed_fills = [(int(fill.get('timeStamp', 0)), fill) for fill in fills]
+                    timed_fills.sort(key=operator.itemgetter(0))
                     
                     # Filter out fills we've already processed
-                    new_fills = []
-                    for fill in fills:
-                        fill_timestamp = int(fill.get('timeStamp', 0))
-                        if self.last_timestamp is None or fill_timestamp > self.last_timestamp:
-                            new_fills.append(fill)
+                    last_timestamp = self.last_timestamp
+                    new_fills = [fill for fill_timestamp, fill in timed_fills
+                                 if last_timestamp is None or fill_timestamp > last_timestamp]
                     
                     if new_fills:
-                        saved_count = self.save_fills_to_csv(new_fills)
+                        # Hand the batch to the writer thread and poll again without waiting for the disk
+                        self.fill_queue.put(new_fills)
                         
-                        # Update last timestamp
-                        self.last_timestamp = int(new_fills[-1].get('timeStamp', 0))
+                        # Update last timestamp (the newest fill is last after the sort)
+                        self.last_timestamp = timed_fills[-1][0]
                         
-                        logger.info(f"Processed {saved_count} new fills. Latest timestamp: {self.last_timestamp}")
+                        logger.debug(f"Queued {len(new_fills)} new fills. Latest timestamp: {self.last_timestamp}")
                     else:
                         logger.debug("No new fills since last check")
                 else:
                     logger.debug("No fills returned from API")
+                    new_fills = []
+
+                # Poll at the base rate while fills arrive, back off exponentially while idle
+                if new_fills:
+                    self.current_interval = self.poll_interval
+                else:
+                    self.current_interval = min(self.current_interval * 2, max(MAX_POLL_INTERVAL, self.poll_interval))
                 
-                # Wait before next poll
-                logger.debug(f"Waiting {self.poll_interval} seconds before next check...")
-                time.sleep(self.poll_interval)
+                # Wait before next poll; returns early when a stop is requested
+                logger.debug(f"Waiting {self.current_interval} seconds before next check...")
+                if stop_event.wait(self.current_interval):
+                    break
                 
             except KeyboardInterrupt:
                 logger.info("Received keyboard interrupt, stopping...")
@@ -557,8 +852,12 @@ class FillMonitor:
                     logger.error("Too many consecutive errors, stopping")
                     break
                 
-                time.sleep(self.poll_interval)
+                if stop_event.wait(self.poll_interval):
+                    break
         
+        self.stop_writer()
+        self.lookup_pool.shutdown(wait=False)
+        self.close_csv()
         logger.info("Fill Monitor stopped")
 
 def main():
@@ -1,13 +1,83 @@
 # uikitxv2/src/components/datatable.py
 
+import sys
+from types import MappingProxyType
+
 from dash import dash_table
+import numpy as np
 import pandas as pd
 
 # Corrected relative import: Go up one level (..) to src, then down to core
-from ..core import BaseComponent
+from ..core import BaseComponent, cached_render
 # Corrected relative import: Go up one level (..) to src, then down to utils
 from ..themes import default_theme, get_datatable_default_styles
 
+# Read-only default for omitted style arguments, shared by every instance
+_EMPTY = MappingProxyType({})
+
+
+def _df_to_records(df):
+    """
+    Convert a DataFrame to a list of row dicts, like ``df.to_dict('records')`` but faster.
+
+    Each column is converted to Python objects once with ``tolist()`` and the
+    rows are zipped back together, instead of pandas boxing every cell per row.
+    A frame whose columns all share one numeric dtype is converted in a single
+    ``to_numpy().tolist()`` call.
+
+    Unlike ``to_dict('records')``, datetime columns come out as the ISO strings
+    Dash would send (NaT as None) rather than Timestamps: Dash encodes with
+    orjson, and a single Timestamp anywhere in the response makes it fall back
+    to re-walking the whole response in Python.
+
+    Args:
+        df (pd.DataFrame): The frame to convert.
+
+    Returns:
+        list[dict]: One dict per row, keyed by column label.
+    """
+    columns = df.columns.tolist()
+    dtypes = df.dtypes
+    if len(columns) and all(dtype == dtypes.iloc[0] for dtype in dtypes) and isinstance(dtypes.iloc[0], np.dtype) \
+            and dtypes.iloc[0].kind in "biuf":
+        rows = df.to_numpy().tolist()
+    else:
+        values = []
+        for i, dtype in enumerate(dtypes):
+            column_values = df.iloc[:, i].tolist()
+            if dtype.kind == "M":
+                column_values = [None if v is pd.NaT else v.to_pydatetime(warn=False).isoformat()
+                                 for v in column_values]
+            elif not isinstance(dtype, np.dtype):
+                # Nullable extension columns hold pd.NA, which to_dict('records') reports as None
+                column_values = [None if v is pd.NA else v for v in column_values]
+            values.append(column_values)
+        rows = zip(*values)
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def _merged(defaults, overrides):
+    """
+    Copy of the ``defaults`` style dict updated with ``overrides``.
+
+    A real dict rather than a ChainMap view, so Dash's orjson encoder takes
+    it directly.
+    """
+    merged = defaults.copy()
+    merged.update(overrides)
+    return merged
+
+
+def _column_defs(names):
+    """
+    Column definitions for a table whose columns are named after their keys.
+
+    String names are interned, so "name", "id" and every other table built
+    over the same columns share one string object.
+    """
+    names = [sys.intern(name) if type(name) is str else name for name in names]
+    return [{"name": name, "id": name} for name in names]
+
 class DataTable(BaseComponent):
     """
     A wrapper for dash_table.DataTable with theme integration.
@@ -15,14 +85,21 @@ class DataTable(BaseComponent):
     This component creates a styled data table using Dash's DataTable component,
     with automatic theming support. It handles both dict-based data and pandas DataFrames.
     """
+
+    __slots__ = (
+        'data', 'columns', 'style_table', 'style_cell', 'style_header',
+        'style_data_conditional', 'page_size', 'className',
+    )
+
     def __init__(self, id, data=None, columns=None, theme=None, style_table=None, style_cell=None, style_header=None, style_data_conditional=None, page_size=10, className=""):
         """
         Initialize a DataTable component.
         
         Args:
             id (str): The component's unique identifier.
-            data (list or DataFrame, optional): Data to display in the table. Can be a list of dicts
-                or a pandas DataFrame. Defaults to None (empty list).
+            data (list or DataFrame, optional): Data to display in the table. Can be a list of dicts,
+                a pandas DataFrame or, if polars is installed, a polars DataFrame.
+                Defaults to None (an empty tuple).
             columns (list, optional): Column definitions. If None and data is provided, 
                 will be auto-generated from data keys. Defaults to None.
             theme (dict, optional): Theme configuration. Defaults to None.
@@ -30,28 +107,48 @@ class DataTable(BaseComponent):
             style_cell (dict, optional): Styles for all cells. Defaults to None.
             style_header (dict, optional): Styles for header cells. Defaults to None.
             style_data_conditional (list, optional): Conditional styling rules. Defaults to None.
+                The style arguments are stored as read-only copies; assign new
+                ones to change them.
             page_size (int, optional): Number of rows per page. Defaults to 10.
             className (str, optional): Additional CSS class names. Not directly used by dash_table.
                 Defaults to "".
         """
         # Note: className is accepted here but NOT passed to dash_table.DataTable below
         super().__init__(id, theme)
-        self.data = data if data is not None else []
-        self.columns = columns if columns is not None else []
-        self.style_table = style_table if style_table is not None else {}
-        self.style_cell = style_cell if style_cell is not None else {}
-        self.style_header = style_header if style_header is not None else {}
-        self.style_data_conditional = style_data_conditional if style_data_conditional is not None else []
+        self.data = data if data is not None else ()
+        self.columns = columns if columns is not None else ()
+        self.style_table = MappingProxyType(dict(style_table)) if style_table is not None else _EMPTY
+        self.style_cell = MappingProxyType(dict(style_cell)) if style_cell is not None else _EMPTY
+        self.style_header = MappingProxyType(dict(style_header)) if style_header is not None else _EMPTY
+        self.style_data_conditional = tuple(style_data_conditional) if style_data_conditional is not None else ()
         self.page_size = page_size
         self.className = className # Store it, but don't pass it directly to dash_table
 
-        # Basic validation or processing if needed
-        if isinstance(self.data, pd.DataFrame):
-            self.data = self.data.to_dict('records')
+        # Basic validation or processing if needed. polars is optional and slow to
+        # import; data can only be a polars frame if the caller already imported it
+        pl = sys.modules.get("polars")
+        if pl is not None and isinstance(self.data, pl.DataFrame):
+            # polars builds the row dicts in Rust
+            df = self.data
+            self.data = df.to_dicts()
+            if not self.columns and self.data:
+                self.columns = _column_defs(df.columns)
+        elif isinstance(self.data, pd.DataFrame):
+            df = self.data
+            self.data = _df_to_records(df)
+            if not self.columns and self.data:
+                self.columns = _column_defs(dict.fromkeys(df.columns.tolist()))
         if not self.columns and self.data:
-            sample_record = self.data[0]
-            self.columns = [{"name": i, "id": i} for i in sample_record.keys()]
+            self.columns = _column_defs(self.data[0])
+
+    def _render_signature(self):
+        """Everything render() reads, compared by identity to reuse the last table."""
+        return (
+            self.id, self.theme, self.columns, self.data, self.page_size,
+            self.style_table, self.style_cell, self.style_header, self.style_data_conditional,
+        )
 
+    @cached_render
     def render(self):
         """
         Render the data table component.
@@ -63,18 +160,29 @@ class DataTable(BaseComponent):
             dash_table.DataTable: The rendered Dash DataTable component.
         """
         # Get default styles based on theme
-        default_styles = get_datatable_default_styles(self.theme)
+        default_styles = self._memoized("default_styles", (self.theme,),
+                                        lambda: get_datatable_default_styles(self.theme))
         
-        # Merge default styles with instance-specific styles
-        final_style_table = {**default_styles["style_table"], **self.style_table}
-        final_style_cell = {**default_styles["style_cell"], **self.style_cell}
-        final_style_header = {**default_styles["style_header"], **self.style_header}
+        # Merge default styles with instance-specific styles; each merge is
+        # rebuilt only when the theme or that style object is replaced
+        final_style_table = self._memoized(
+            "style_table", (self.theme, self.style_table),
+            lambda: _merged(default_styles["style_table"], self.style_table),
+        )
+        final_style_cell = self._memoized(
+            "style_cell", (self.theme, self.style_cell),
+            lambda: _merged(default_styles["style_cell"], self.style_cell),
+        )
+        final_style_header = self._memoized(
+            "style_header", (self.theme, self.style_header),
+            lambda: _merged(default_styles["style_header"], self.style_header),
+        )
         
         # Merge conditional styles, prioritizing instance-specific ones
-        final_style_data_conditional = [
-            *default_styles["style_data_conditional"],
-            *self.style_data_conditional
-        ]
+        final_style_data_conditional = self._memoized(
+            "style_data_conditional", (self.theme, self.style_data_conditional),
+            lambda: [*default_styles["style_data_conditional"], *self.style_data_conditional],
+        )
 
         # If you need to use self.className, wrap the DataTable in an html.Div:
         # return html.Div(className=self.className, children=[ dash_table.DataTable(...) ])
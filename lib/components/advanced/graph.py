@@ -1,10 +1,13 @@
 # uikitxv2/src/components/graph.py
 
+from types import MappingProxyType
+
 from dash import dcc
-import plotly.graph_objects as go
+import orjson
+import plotly.io as pio
 
 # Corrected relative import: Go up one level (..) to src, then down to core
-from ..core import BaseComponent
+from ..core import BaseComponent, cached_render
 # Corrected relative import: Go up one level (..) to src, then down to utils
 from ..themes import default_theme, get_graph_figure_layout_defaults, get_graph_wrapper_default_style
 
@@ -12,6 +15,9 @@ class Graph(BaseComponent):
     """
     A wrapper for dcc.Graph with theme integration for layout.
     """
+
+    __slots__ = ('figure', 'style', 'config', 'className')
+
     def __init__(
         self,
         id,
@@ -27,42 +33,87 @@ class Graph(BaseComponent):
             id: The unique component identifier.
             figure: A Plotly figure object to display.
             theme: Optional theme configuration for styling.
-            style: CSS style overrides for the wrapper.
+            style: CSS style overrides for the wrapper. Stored as a read-only
+                copy; assign a new dict to change it.
             config: Additional Plotly configuration options.
             className: Additional CSS class names for the wrapper.
         """
         super().__init__(id, theme)
-        self.figure = figure if figure is not None else go.Figure()
-        self.style = style if style is not None else {'height': '400px'} # Default height
+        if figure is None:
+            import plotly.graph_objects as go  # Only needed for the empty default
+            figure = go.Figure()
+        self.figure = figure
+        self.style = MappingProxyType(dict(style) if style is not None else {'height': '400px'}) # Default height
         self.config = config if config is not None else {'displayModeBar': False} # Example config
         self.className = className
 
-        # Apply theme defaults to the figure layout
-        self._apply_theme_to_figure()
+        # Apply theme defaults to the figure layout and serialize it up front
+        self._figure_json()
+
+    def set_figure(self, figure):
+        """Replace the displayed figure and rebuild its cached JSON.
+
+        Also the way to publish in-place edits (``add_trace``, ``update_layout``)
+        made to the current figure object, which the cache cannot see.
+
+        Args:
+            figure: The new Plotly figure object.
+        """
+        self.figure = figure
+        self._render_memo.clear()
+        self._figure_json()
 
     def _apply_theme_to_figure(self):
-        """Applies theme colors to the figure layout."""
+        """Applies theme colors to the figure layout.
+
+        update_layout validates every property, so it only runs when the theme
+        or the figure object has been replaced since it last ran; assign a new
+        figure (or theme) to have it re-applied.
+        """
         if self.figure and hasattr(self.figure, 'update_layout'):
             # Get default layout settings from the centralized styling function
-            default_layout = get_graph_figure_layout_defaults(self.theme)
-            self.figure.update_layout(**default_layout)
+            self._memoized(
+                "themed_figure", (self.theme, self.figure),
+                lambda: self.figure.update_layout(**get_graph_figure_layout_defaults(self.theme)),
+            )
+
+    def _figure_json(self):
+        """Return the themed figure as the plain dict Dash sends to the browser.
+
+        Serializing a figure (validation, numpy and datetime encoding) is most
+        of the render cost, so it is done once per figure/theme with orjson
+        and the decoded dict is reused; Dash re-encodes a plain dict cheaply.
+        """
+        def build():
+            self._apply_theme_to_figure()
+            return orjson.loads(pio.to_json(self.figure, validate=False, engine='orjson'))
+
+        return self._memoized("figure_json", (self.theme, self.figure), build)
 
+    def _render_signature(self):
+        """Everything render() reads, compared by identity to reuse the last graph."""
+        return (self.id, self.theme, self.figure, self.style, self.config, self.className)
+
+    @cached_render
     def render(self):
         """Render the graph as a Dash ``dcc.Graph`` component.
 
         Returns:
             dcc.Graph: The graph component with themed layout and styles.
         """
-        # Ensure theme is applied before rendering
-        self._apply_theme_to_figure()
+        # Themed and serialized again only if the figure or theme was replaced
+        figure = self._figure_json()
 
-        # Get default wrapper style and merge with instance style
-        default_wrapper_style = get_graph_wrapper_default_style(self.theme)
-        final_style = {**{'height': '400px'}, **default_wrapper_style, **self.style}
+        # Get default wrapper style and merge with instance style; rebuilt only
+        # when the theme or the style object is replaced
+        final_style = self._memoized(
+            "style", (self.theme, self.style),
+            lambda: {**{'height': '400px'}, **get_graph_wrapper_default_style(self.theme), **self.style},
+        )
 
         return dcc.Graph(
             id=self.id,
-            figure=self.figure,
+            figure=figure,
             style=final_style,
             config=self.config,
             className=self.className
@@ -1,5 +1,8 @@
 # uikitxv2/src/components/grid.py
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import dash_bootstrap_components as dbc
 from dash import html
 from dash.development.base_component import Component as DashBaseComponent
@@ -9,6 +12,67 @@ from ..core import BaseComponent
 # Corrected relative import: Go up one level (..) to src, then down to utils
 from ..themes import default_theme, get_grid_default_style
 
+# Read-only default for omitted style and width arguments, shared by every instance
+_EMPTY = MappingProxyType({})
+
+
+def _render_component(component):
+    """Child handler for our own components and other objects with a render() method."""
+    return component.render()
+
+
+def _pass_through(component):
+    """Child handler for Dash components, dicts, strings and anything else already renderable."""
+    return component
+
+
+def _render_if_renderable(component):
+    """Child handler for types not known in advance: decide per instance."""
+    if hasattr(component, 'render') and callable(component.render):
+        return component.render()
+    return component
+
+
+@lru_cache(maxsize=256)
+def _child_handler(child_type):
+    """
+    Pick the render handler for a child's type, once per type.
+
+    Replaces the per-child isinstance/hasattr chain: BaseComponent subclasses
+    are rendered, Dash components, dicts and strings pass through unchanged,
+    and for any other type the render() check is made per instance.
+    """
+    if issubclass(child_type, BaseComponent):
+        return _render_component
+    if issubclass(child_type, (DashBaseComponent, dict, str)):
+        return _pass_through
+    return _render_if_renderable
+
+
+@lru_cache(maxsize=64, typed=True)
+def _int_width_args(width):
+    """Read-only dbc.Col kwargs for an int width, shared by every child given that width."""
+    return MappingProxyType({'width': width})
+
+
+def _width_args(width_spec):
+    """dbc.Col keyword arguments for the width part of a (component, width) child."""
+    if isinstance(width_spec, dict):
+        # Assumes dict specifies widths like {'xs': 12, 'md': 6}
+        return width_spec
+    if isinstance(width_spec, int):
+        # Assumes int is the default width (applied to all sizes unless overridden)
+        return _int_width_args(width_spec)
+    return _EMPTY
+
+
+def _split_child(child_item):
+    """(component, dbc.Col keyword arguments) for one Grid child."""
+    if isinstance(child_item, tuple) and len(child_item) == 2:
+        return child_item[0], _width_args(child_item[1])
+    # Assume the item is just the component, let Col auto-size
+    return child_item, _EMPTY
+
 class Grid(BaseComponent):
     """
     A wrapper for creating a grid layout using dbc.Row and dbc.Col.
@@ -26,6 +90,9 @@ class Grid(BaseComponent):
             ]
         )
     """
+
+    __slots__ = ('children', 'style', 'className')
+
     def __init__(self, id, children=None, theme=None, style=None, className=""):
         """
         Initialize a Grid component.
@@ -34,14 +101,15 @@ class Grid(BaseComponent):
             id (str): The component's unique identifier.
             children (list, optional): List of child components or tuples (component, width_dict).
                 Width dict can be like {'xs': 12, 'md': 6, 'lg': 4} or just a number.
-                Defaults to None (empty list).
+                Defaults to None (an empty tuple).
             theme (dict, optional): Theme configuration. Defaults to None.
             style (dict, optional): Additional CSS styles to apply. Defaults to None.
+                Stored as a read-only copy; assign a new dict to change it.
             className (str, optional): Additional CSS class names. Defaults to "".
         """
         super().__init__(id, theme)
-        self.children = children if children is not None else []
-        self.style = style if style is not None else {}
+        self.children = children if children is not None else ()
+        self.style = MappingProxyType(dict(style)) if style is not None else _EMPTY
         self.className = className
 
     def _build_cols(self):
@@ -54,41 +122,16 @@ class Grid(BaseComponent):
         Returns:
             list: List of dbc.Col components with rendered children.
         """
-        cols = []
         children_to_process = self.children
         if not isinstance(children_to_process, (list, tuple)):
              children_to_process = [children_to_process]
 
-        for child_item in children_to_process:
-            child_component = None
-            width_args = {} # Default: Col will auto-size
-
-            if isinstance(child_item, tuple) and len(child_item) == 2:
-                child_component = child_item[0]
-                if isinstance(child_item[1], dict):
-                    # Assumes dict specifies widths like {'xs': 12, 'md': 6}
-                    width_args = child_item[1]
-                elif isinstance(child_item[1], int):
-                    # Assumes int is the default width (applied to all sizes unless overridden)
-                    width_args = {'width': child_item[1]} # Use 'width' key for default span
-            else:
-                # Assume the item is just the component, let Col auto-size
-                child_component = child_item
-
-            rendered_child = None
-            # Check if it's one of our custom components or needs rendering
-            if isinstance(child_component, BaseComponent) or \
-               (hasattr(child_component, 'render') and callable(child_component.render) and \
-               not isinstance(child_component, (DashBaseComponent, dict, str))):
-                rendered_child = child_component.render()
-            else:
-                # Assume it's already a Dash component, dict, string, etc.
-                rendered_child = child_component
-
-            if rendered_child is not None:
-                 cols.append(dbc.Col(rendered_child, **width_args)) # Pass width dict as kwargs
-
-        return cols
+        col = dbc.Col
+        rendered = (
+            (_child_handler(type(component))(component), width_args)
+            for component, width_args in map(_split_child, children_to_process)
+        )
+        return [col(child, **width_args) for child, width_args in rendered if child is not None]
 
     def render(self):
         """
@@ -101,11 +144,12 @@ class Grid(BaseComponent):
             dash_bootstrap_components.Row: The rendered Dash Bootstrap row component
             containing the columns with child components.
         """
-        # Get default styles from the centralized styling function
-        default_style = get_grid_default_style(self.theme)
-        
-        # Merge default styles with instance-specific styles
-        final_style = {**default_style, **self.style}
+        # Merge default styles with instance-specific styles; rebuilt only when
+        # the theme or the style object is replaced
+        final_style = self._memoized(
+            "style", (self.theme, self.style),
+            lambda: {**get_grid_default_style(self.theme), **self.style},
+        )
 
         return dbc.Row(
             children=self._build_cols(),
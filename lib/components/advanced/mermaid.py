@@ -1,13 +1,16 @@
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
-import dash_extensions
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
 from ..core import MermaidProtocol
 from ..themes import get_mermaid_default_styles, Theme, default_theme
 
+# Read-only default for omitted style / chart_config arguments
+_EMPTY = MappingProxyType({})
+
 class Mermaid(MermaidProtocol):
     """
     Mermaid diagram component for rendering mermaid.js diagrams.
@@ -24,8 +27,62 @@ class Mermaid(MermaidProtocol):
             theme (Optional[Theme]): The theme to use for styling. 
                 If not provided, the default theme will be used.
         """
+        self.rebind_theme(theme)
+
+    def rebind_theme(self, theme: Optional[Theme] = None) -> None:
+        """
+        Switch to another theme and rebuild everything derived from it.
+
+        The theme's colours are resolved once here rather than on every
+        render, so assigning ``self.theme`` directly has no effect on output;
+        call this instead.
+
+        Args:
+            theme (Optional[Theme]): The new theme. If not provided, the
+                default theme will be used.
+        """
         self.theme = theme or default_theme
         self.default_styles = get_mermaid_default_styles(self.theme)
+        # Header styles are fixed by the theme, so every render shares them
+        self._title_style = {"color": self.theme.text_light}
+        self._desc_style = {"color": self.theme.text_subtle}
+        # Last merged container style / mermaid config, keyed by the argument object
+        self._merge_cache = {}
+
+    def _merged(self, key: str, source: Any, merge) -> Any:
+        """
+        Return ``merge(source)``, reusing the previous result while ``source`` is the same object.
+
+        Callers re-rendering with the same style or chart_config dict get the
+        same merged dict back instead of a fresh deep merge; pass a new dict
+        (not an in-place edit of the old one) to change it.
+        """
+        cached = self._merge_cache.get(key)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        merged = merge(source)
+        self._merge_cache[key] = (source, merged)
+        return merged
+
+    def _merge_chart_config(self, chart_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a render() chart_config over the theme's mermaid config."""
+        mermaid_config = self.default_styles["mermaid_config"].copy()
+
+        # Deep merge of nested theme variables if provided
+        if chart_config.get("themeVariables"):
+            mermaid_config["themeVariables"] = {
+                **mermaid_config.get("themeVariables", _EMPTY), 
+                **chart_config.get("themeVariables", _EMPTY)
+            }
+            # Remove theme variables from chart_config to avoid duplication
+            chart_config_clean = chart_config.copy()
+            chart_config_clean.pop("themeVariables", None)
+            # Merge other chart configs
+            mermaid_config.update(chart_config_clean)
+        else:
+            # Simple merge if no theme variables
+            mermaid_config.update(chart_config)
+        return mermaid_config
         
     def apply_theme(self, theme_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -76,41 +133,34 @@ class Mermaid(MermaidProtocol):
         Returns:
             dash.html.Div: A container with the rendered Mermaid component.
         """
-        # Get styles
-        style = kwargs.pop("style", {})
-        container_style = {**self.default_styles["style"], **style}
-        
-        # Get Mermaid configuration
-        chart_config = kwargs.pop("chart_config", {})
-        mermaid_config = self.default_styles["mermaid_config"].copy()
+        # Get styles (merged again only for a new style dict)
+        style = kwargs.pop("style", _EMPTY)
+        container_style = self._merged(
+            "style", style, lambda style: {**self.default_styles["style"], **style}
+        )
         
+        # Get Mermaid configuration; without a chart_config the theme's own
+        # config is used as is
+        chart_config = kwargs.pop("chart_config", _EMPTY)
         if chart_config:
-            # Deep merge of nested theme variables if provided
-            if chart_config.get("themeVariables"):
-                mermaid_config["themeVariables"] = {
-                    **mermaid_config.get("themeVariables", {}), 
-                    **chart_config.get("themeVariables", {})
-                }
-                # Remove theme variables from chart_config to avoid duplication
-                chart_config_clean = chart_config.copy()
-                chart_config_clean.pop("themeVariables", None)
-                # Merge other chart configs
-                mermaid_config.update(chart_config_clean)
-            else:
-                # Simple merge if no theme variables
-                mermaid_config.update(chart_config)
+            mermaid_config = self._merged("chart_config", chart_config, self._merge_chart_config)
+        else:
+            mermaid_config = self.default_styles["mermaid_config"]
         
         # Optional title and description
         title = kwargs.pop("title", None)
         description = kwargs.pop("description", None)
         className = kwargs.pop("className", "")
         
+        # Imported on first render so importing this module doesn't need dash-extensions
+        import dash_extensions
+
         # Create component hierarchy
         header_elements = []
         if title:
-            header_elements.append(html.H4(title, style={"color": self.theme.text_light}))
+            header_elements.append(html.H4(title, style=self._title_style))
         if description:
-            header_elements.append(html.P(description, style={"color": self.theme.text_subtle}))
+            header_elements.append(html.P(description, style=self._desc_style))
         
         return html.Div([
             # Optional header
@@ -122,4 +172,4 @@ class Mermaid(MermaidProtocol):
                 config=mermaid_config,
                 **kwargs
             )
-        ], style=container_style, className=f"uikitx-mermaid {className}".strip()) 
\ No newline at end of file
+        ], style=container_style, className=f"uikitx-mermaid {className}".strip() if className else "uikitx-mermaid") 
\ No newline at end of file
@@ -1,12 +1,18 @@
 # uikitxv2/src/components/button.py
 
+import json
+from types import MappingProxyType
+
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import html, Input, Output
 
 # Import from parent directories in the new structure
-from ..core import BaseComponent
+from ..core import BaseComponent, cached_render
 from ..themes import default_theme, get_button_default_style
 
+# Read-only default for omitted style arguments, shared by every instance
+_EMPTY = MappingProxyType({})
+
 class Button(BaseComponent):
     """
     A wrapper for dbc.Button that integrates with the theme system.
@@ -14,7 +20,11 @@ class Button(BaseComponent):
     This component creates a styled button using Dash Bootstrap Components,
     with automatic theming support.
     """
-    def __init__(self, id, label="Button", theme=None, style=None, n_clicks=0, className=""):
+
+    __slots__ = ('label', 'style', 'n_clicks', 'className', 'clientside_style_toggle')
+
+    def __init__(self, id, label="Button", theme=None, style=None, n_clicks=0, className="",
+                 clientside_style_toggle=None):
         """
         Initialize a Button component.
         
@@ -23,15 +33,45 @@ class Button(BaseComponent):
             label (str, optional): Text to display on the button. Defaults to "Button".
             theme (dict, optional): Theme configuration. Defaults to None.
             style (dict, optional): Additional CSS styles to apply. Defaults to None.
+                Stored as a read-only copy; assign a new dict to change it.
             n_clicks (int, optional): Initial click count. Defaults to 0.
             className (str, optional): Additional CSS class names. Defaults to "".
+            clientside_style_toggle (tuple, optional): ``(target_id, style_off, style_on)``.
+                When set, register_clientside() wires clicks to toggle the target's
+                style in the browser, without a server round trip. Defaults to None.
         """
         super().__init__(id, theme)
         self.label = label
-        self.style = style if style is not None else {}
+        self.style = MappingProxyType(dict(style)) if style is not None else _EMPTY
         self.n_clicks = n_clicks
         self.className = className
+        self.clientside_style_toggle = clientside_style_toggle
+
+    def register_clientside(self, app):
+        """
+        Register the clientside style toggle on a Dash app.
+
+        Odd click counts apply ``style_on`` to the target component, even counts
+        ``style_off``; the callback runs in the browser, so clicks never reach
+        the server. Does nothing if no clientside_style_toggle was given.
 
+        Args:
+            app (dash.Dash): The app the button's layout is served from.
+        """
+        if self.clientside_style_toggle is None:
+            return
+        target_id, style_off, style_on = self.clientside_style_toggle
+        app.clientside_callback(
+            f"function(n_clicks) {{ return (n_clicks || 0) % 2 ? {json.dumps(style_on)} : {json.dumps(style_off)}; }}",
+            Output(target_id, "style"),
+            Input(self.id, "n_clicks"),
+        )
+
+    def _render_signature(self):
+        """Everything render() reads, compared by identity to reuse the last button."""
+        return (self.id, self.theme, self.label, self.n_clicks, self.style, self.className)
+
+    @cached_render
     def render(self):
         """
         Render the button component.
@@ -39,11 +79,12 @@ class Button(BaseComponent):
         Returns:
             dash_bootstrap_components.Button: The rendered Dash Bootstrap button component.
         """
-        # Get default styles based on the theme
-        default_style = get_button_default_style(self.theme)
-
-        # Merge default styles with instance-specific styles
-        final_style = {**default_style, **self.style}
+        # Merge default styles with instance-specific styles; rebuilt only when
+        # the theme or the style object is replaced
+        final_style = self._memoized(
+            "style", (self.theme, self.style),
+            lambda: {**get_button_default_style(self.theme), **self.style},
+        )
 
         return dbc.Button(
             self.label,
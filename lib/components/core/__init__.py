@@ -1,6 +1,6 @@
 """Core components and protocols"""
 
-from .base_component import BaseComponent
+from .base_component import BaseComponent, cached_render
 from .protocols import MermaidProtocol, DataServiceProtocol
 
-__all__ = ["BaseComponent", "MermaidProtocol", "DataServiceProtocol"] 
\ No newline at end of file
+__all__ = ["BaseComponent", "cached_render", "MermaidProtocol", "DataServiceProtocol"] 
\ No newline at end of file
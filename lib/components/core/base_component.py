@@ -2,22 +2,43 @@
 """
 Base component for all UI components in the UIKit v2 library.
 
-This module provides the abstract base class that all UI components must inherit from,
+This module provides the base class that all UI components must inherit from,
 ensuring consistent interface and theme handling across the component library.
 """
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import copy
+import functools
 from ..themes import default_theme
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-class BaseComponent(ABC):
+
+def cached_render(render: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Decorator for a subclass's render() that skips rebuilding an unchanged component.
+
+    The wrapped class defines ``_render_signature()``, returning every object
+    the rendered output depends on. While those are the same objects as at the
+    last render, a shallow copy of the previous Dash component is returned
+    instead of constructing (and prop-validating) a new one. Props are shared
+    with the cached component, so in-place edits to e.g. a data list still show.
     """
-    Abstract base class for all wrapped UI controls.
+    @functools.wraps(render)
+    def wrapper(self):
+        return copy.copy(self._memoized("render", self._render_signature(), lambda: render(self)))
+    return wrapper
+
+class BaseComponent:
+    """
+    Base class for all wrapped UI controls.
     Ensures components have an ID and a theme.
     """
 
+    # Fixed attribute sets keep the many small component instances of a layout
+    # dict-free; subclasses declare their own attributes the same way
+    __slots__ = ('id', 'theme', '_render_memo', '__weakref__')
+
     def __init__(self, id: str, theme: Any = None):
         """
         Initializes the base component.
@@ -37,18 +58,37 @@ class BaseComponent(ABC):
         self.id = id
         # Assign the provided theme or use the default theme if none is given.
         self.theme = theme if theme is not None else default_theme
+        # Values derived during render(), reused while their key is unchanged
+        self._render_memo = {}
 
         # --- DIAGNOSTIC PRINT (Optional, can remove later) ---
         # print(f"--- BaseComponent.__init__ finished for ID: {id} ---")
         # -------------------------------------------------------
 
 
-    @abstractmethod
+    def _memoized(self, name: str, deps: tuple, build: Callable[[], Any]) -> Any:
+        """
+        Return the value last built under ``name`` if ``deps`` are the same objects, otherwise rebuild it.
+
+        Used by render() to keep merged style dicts across re-renders instead of
+        rebuilding them every time. ``deps`` must hold every object the value
+        depends on, e.g. ``(self.theme, self.style)``; they are compared by
+        identity and kept referenced, so a replaced object always triggers a rebuild.
+        """
+        cached = self._render_memo.get(name)
+        if cached is not None and len(cached[0]) == len(deps) and all(a is b for a, b in zip(cached[0], deps)):
+            return cached[1]
+        value = build()
+        self._render_memo[name] = (deps, value)
+        return value
+
     def render(self) -> Any:  # Dash Component, but keep generic to avoid heavy import
         """
-        Abstract method that must be implemented by subclasses.
+        Must be implemented by subclasses.
         Should return a Dash component (e.g., dcc.Input, dbc.Button, html.Div)
         or a dictionary representing one, ready to be included in app.layout.
-        """
-        pass # Subclasses must provide their rendering logic
 
+        Not an ABC abstract method, so constructing components skips ABCMeta's
+        abstract-method check; a missing override fails here instead.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement render()")
@@ -1,21 +1,21 @@
 """Protocol definitions for UIKitXv2 components and services"""
 
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Protocol, Tuple, runtime_checkable
 from pathlib import Path
 import pandas as pd
 
 
-class MermaidProtocol(ABC):
+@runtime_checkable
+class MermaidProtocol(Protocol):
     """
     Protocol for Mermaid diagram components.
     
-    This abstract base class defines the interface for Mermaid diagram
-    components that render diagrams using Mermaid syntax.
+    This protocol defines the interface for Mermaid diagram components that
+    render diagrams using Mermaid syntax. Implementations may subclass it
+    or just match it structurally.
     """
     
-    @abstractmethod
     def render(self, id: str, graph_definition: str, **kwargs) -> Any:
         """
         Render a Mermaid diagram.
@@ -28,9 +28,8 @@ class MermaidProtocol(ABC):
         Returns:
             Any: The rendered component.
         """
-        pass
+        ...
     
-    @abstractmethod
     def apply_theme(self, theme_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply theme configuration to the component.
@@ -41,18 +40,18 @@ class MermaidProtocol(ABC):
         Returns:
             Dict[str, Any]: Updated theme configuration.
         """
-        pass
+        ...
 
 
-class DataServiceProtocol(ABC):
+@runtime_checkable
+class DataServiceProtocol(Protocol):
     """
-    Abstract protocol for ActantEOD data service operations.
+    Protocol for ActantEOD data service operations.
     
     This protocol defines the interface for data loading, processing, and querying
     operations for Actant scenario metrics data.
     """
     
-    @abstractmethod
     def load_data_from_json(self, json_file_path: Path) -> bool:
         """
         Load and process data from a JSON file into the service.
@@ -63,9 +62,8 @@ class DataServiceProtocol(ABC):
         Returns:
             True if data was loaded successfully, False otherwise
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_scenario_headers(self) -> List[str]:
         """
         Get list of unique scenario headers from the loaded data.
@@ -73,9 +71,8 @@ class DataServiceProtocol(ABC):
         Returns:
             List of scenario header strings
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_shock_types(self) -> List[str]:
         """
         Get list of unique shock types from the loaded data.
@@ -83,9 +80,8 @@ class DataServiceProtocol(ABC):
         Returns:
             List of shock type strings (e.g., "percentage", "absolute_usd")
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_metric_names(self) -> List[str]:
         """
         Get list of available metric names from the loaded data.
@@ -93,9 +89,8 @@ class DataServiceProtocol(ABC):
         Returns:
             List of metric name strings
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_filtered_data(
         self, 
         scenario_headers: Optional[List[str]] = None,
@@ -113,9 +108,8 @@ class DataServiceProtocol(ABC):
         Returns:
             Filtered pandas DataFrame
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_data_summary(self) -> Dict[str, Any]:
         """
         Get summary statistics about the loaded data.
@@ -123,9 +117,8 @@ class DataServiceProtocol(ABC):
         Returns:
             Dictionary containing data summary information
         """
-        pass
+        ...
     
-    @abstractmethod
     def is_data_loaded(self) -> bool:
         """
         Check if data has been successfully loaded.
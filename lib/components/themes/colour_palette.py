@@ -1,7 +1,9 @@
 # src/utils/colour_palette.py
 
 from __future__ import annotations
-from typing import Any, List, Dict
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, List, Mapping
 from dataclasses import dataclass
 
 __all__ = [
@@ -73,7 +75,32 @@ default_theme = Theme(
 
 # --- Component Default Style Functions ---
 
-def get_combobox_default_style(theme: Theme) -> dict[str, Any]:
+def _cached_style(getter):
+    """
+    Build a style getter's result once per (theme, arguments) and share it.
+
+    Theme is frozen and hashable, so it can key an lru_cache directly. The
+    default_theme styles are built at import and returned without even
+    hashing the theme, which is what nearly every call asks for. The shared
+    dict is returned as a read-only MappingProxyType; copy it (or spread it
+    into a new dict) before changing anything, nested dicts included.
+    """
+    @lru_cache(maxsize=8)
+    def build(*args, **kwargs):
+        return MappingProxyType(getter(*args, **kwargs))
+
+    default_style = build(default_theme)
+
+    @wraps(getter)
+    def get_style(theme, *args, **kwargs):
+        if theme is default_theme and not args and not kwargs:
+            return default_style
+        return build(theme, *args, **kwargs)
+    return get_style
+
+
+@_cached_style
+def get_combobox_default_style(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for ComboBox components.
     
@@ -81,11 +108,12 @@ def get_combobox_default_style(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of CSS style properties.
+        Mapping[str, Any]: Read-only dictionary of CSS style properties.
     """
     return {"backgroundColor": theme.panel_bg, "color": theme.text_light, "borderRadius": "4px"}
 
-def get_button_default_style(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_button_default_style(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for Button components.
     
@@ -93,11 +121,12 @@ def get_button_default_style(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of CSS style properties.
+        Mapping[str, Any]: Read-only dictionary of CSS style properties.
     """
     return {"backgroundColor": theme.primary, "borderColor": theme.primary, "color": theme.text_light, "borderRadius": "4px", "fontFamily": "Inter, sans-serif", "fontSize": "15px", "padding": "0.375rem 0.75rem", "borderWidth": "1px", "borderStyle": "solid", "textDecoration": "none", "display": "inline-block", "fontWeight": "400", "lineHeight": "1.5", "textAlign": "center", "verticalAlign": "middle", "cursor": "pointer", "userSelect": "none"}
 
-def get_container_default_style(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_container_default_style(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for Container components.
     
@@ -105,7 +134,7 @@ def get_container_default_style(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of CSS style properties.
+        Mapping[str, Any]: Read-only dictionary of CSS style properties.
     """
     return {
         "backgroundColor": theme.panel_bg,
@@ -113,7 +142,8 @@ def get_container_default_style(theme: Theme) -> dict[str, Any]:
         "borderRadius": "4px"
     }
 
-def get_datatable_default_styles(theme: Theme) -> Dict[str, Any]:
+@_cached_style
+def get_datatable_default_styles(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for DataTable components.
     
@@ -121,7 +151,7 @@ def get_datatable_default_styles(theme: Theme) -> Dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        Dict[str, Any]: Dictionary containing style settings for different 
+        Mapping[str, Any]: Read-only dictionary containing style settings for different 
         parts of the DataTable (table, header, cells, etc.).
     """
     return {
@@ -153,7 +183,8 @@ def get_datatable_default_styles(theme: Theme) -> Dict[str, Any]:
         "style_as_list_view": True,
     }
 
-def get_graph_figure_layout_defaults(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_graph_figure_layout_defaults(theme: Theme) -> Mapping[str, Any]:
     """
     Get default Plotly figure layout settings with theme colors.
     
@@ -161,7 +192,7 @@ def get_graph_figure_layout_defaults(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of Plotly layout properties.
+        Mapping[str, Any]: Read-only dictionary of Plotly layout properties.
     """
     return {
         "plot_bgcolor": theme.base_bg,
@@ -183,7 +214,8 @@ def get_graph_figure_layout_defaults(theme: Theme) -> dict[str, Any]:
         }
     }
 
-def get_graph_wrapper_default_style(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_graph_wrapper_default_style(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for the Graph component wrapper.
     
@@ -191,11 +223,12 @@ def get_graph_wrapper_default_style(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of CSS style properties.
+        Mapping[str, Any]: Read-only dictionary of CSS style properties.
     """
     return {}
 
-def get_grid_default_style(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_grid_default_style(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for Grid components.
     
@@ -203,11 +236,12 @@ def get_grid_default_style(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary of CSS style properties.
+        Mapping[str, Any]: Read-only dictionary of CSS style properties.
     """
     return {"backgroundColor": theme.panel_bg}
 
-def get_listbox_default_styles(theme: Theme, height_px: int = 160) -> dict[str, Any]:
+@_cached_style
+def get_listbox_default_styles(theme: Theme, height_px: int = 160) -> Mapping[str, Any]:
     """
     Get default styling for ListBox components.
     
@@ -216,7 +250,7 @@ def get_listbox_default_styles(theme: Theme, height_px: int = 160) -> dict[str,
         height_px (int, optional): Height of the listbox in pixels. Defaults to 160.
         
     Returns:
-        dict[str, Any]: Dictionary containing style settings for different
+        Mapping[str, Any]: Read-only dictionary containing style settings for different
         parts of the ListBox (container, inputs, labels).
     """
     return {
@@ -225,7 +259,8 @@ def get_listbox_default_styles(theme: Theme, height_px: int = 160) -> dict[str,
         "labelStyle": {"display": "block", "cursor": "pointer", "padding": "2px 0", "color": theme.text_light}
     }
 
-def get_radiobutton_default_styles(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_radiobutton_default_styles(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for RadioButton components.
     
@@ -233,7 +268,7 @@ def get_radiobutton_default_styles(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary containing style settings for different
+        Mapping[str, Any]: Read-only dictionary containing style settings for different
         parts of the RadioButton (container, inputs, labels).
     """
     return {
@@ -244,7 +279,8 @@ def get_radiobutton_default_styles(theme: Theme) -> dict[str, Any]:
         "labelStyle": {"marginRight": "15px", "cursor": "pointer"}
     }
 
-def get_tabs_default_styles(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_tabs_default_styles(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for Tabs components.
     
@@ -255,7 +291,7 @@ def get_tabs_default_styles(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary containing style settings for different
+        Mapping[str, Any]: Read-only dictionary containing style settings for different
         parts of the Tabs component (container, active tab, labels).
     """
     return {
@@ -306,7 +342,8 @@ def get_tabs_default_styles(theme: Theme) -> dict[str, Any]:
         # }
     }
 
-def get_mermaid_default_styles(theme: Theme) -> dict[str, Any]:
+@_cached_style
+def get_mermaid_default_styles(theme: Theme) -> Mapping[str, Any]:
     """
     Get default styling for Mermaid diagram components.
     
@@ -314,7 +351,7 @@ def get_mermaid_default_styles(theme: Theme) -> dict[str, Any]:
         theme (Theme): The theme to use for styling.
         
     Returns:
-        dict[str, Any]: Dictionary containing style settings and
+        Mapping[str, Any]: Read-only dictionary containing style settings and
         theme configuration for Mermaid diagrams.
     """
     return {
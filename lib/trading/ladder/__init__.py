@@ -1,15 +1,23 @@
 """Ladder trading modules for price ladder visualization and analysis."""
 
-from .price_formatter import decimal_to_tt_bond_format
+from .price_formatter import (
+    decimal_to_tt_bond_format,
+    decimal_to_tt_bond_format_array,
+    decimal_to_tt_bond_components
+)
 from .csv_to_sqlite import (
     csv_to_sqlite_table,
     get_table_schema,
-    query_sqlite_table
+    query_sqlite_table,
+    query_sqlite_table_arrow
 )
 
 __all__ = [
     'decimal_to_tt_bond_format',
+    'decimal_to_tt_bond_format_array',
+    'decimal_to_tt_bond_components',
     'csv_to_sqlite_table',
     'get_table_schema', 
-    'query_sqlite_table'
+    'query_sqlite_table',
+    'query_sqlite_table_arrow'
 ] 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Numba kernels for the TT bond price formatter.
+
+Declared with explicit signatures, so they are compiled (or loaded from the
+on-disk cache) when this module is imported rather than on the first price
+formatted. Only the arithmetic lives here; the strings are assembled by the
+callers in price_formatter.
+"""
+
+import numpy as np
+from numba import float64, int64, njit, void
+
+
+@njit("UniTuple(int64, 2)(float64)", cache=True)
+def tt_bond_parts(price):
+    """(whole points, 64ths) of a decimal price.
+
+    Truncates like int() and rounds the fraction to 64ths half-to-even like
+    round(). A fraction that rounds up to 64/64 is carried into the whole
+    part, so for non-negative prices the 64ths are always in [0, 63].
+    """
+    whole = np.int64(price)
+    sixty_fourths = np.int64(np.rint((price - whole) * 64.0))
+    if sixty_fourths == 64:
+        return whole + 1, np.int64(0)
+    return whole, sixty_fourths
+
+
+@njit(void(float64[::1], int64[::1], int64[::1]), cache=True)
+def tt_bond_parts_batch(prices, out_whole, out_64ths):
+    """tt_bond_parts for every price, written into the two output arrays."""
+    for i in range(prices.shape[0]):
+        out_whole[i], out_64ths[i] = tt_bond_parts(prices[i])
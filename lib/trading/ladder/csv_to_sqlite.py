@@ -1,19 +1,327 @@
 import os
+import threading
+import weakref
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import sqlite3
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger('csv_to_sqlite')
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+# SQLite column types for pandas' inferred dtypes, as DataFrame.to_sql picks them
+_SQLITE_TYPES = {
+    "string": "TEXT",
+    "floating": "REAL",
+    "integer": "INTEGER",
+    "datetime": "TIMESTAMP",
+    "date": "DATE",
+    "time": "TIME",
+    "boolean": "INTEGER",
+}
+
+def _quote_identifier(name):
+    """Double-quote a table or column name for use in SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _column_kind(column):
+    """pandas' inferred dtype for a Series, as DataFrame.to_sql uses it."""
+    inferred = pd.api.types.infer_dtype(column, skipna=True)
+    if inferred == "complex":
+        raise ValueError("Complex datatypes not supported")
+    return inferred
+
+def _merged_kind(kind, column):
+    """
+    Inferred dtype of a column read in pieces, after adding `column` to one of `kind`.
+
+    Follows what pandas infers when it reads the whole column at once: an
+    all-missing piece turns integers into floats and leaves other kinds
+    alone, integers and floats together are floats, and any other mix is
+    read as text.
+    """
+    if column.isna().all():
+        return "floating" if kind == "integer" else kind
+    inferred = _column_kind(column)
+    if inferred == kind:
+        return kind
+    if {kind, inferred} <= {"integer", "floating"}:
+        return "floating"
+    return "string"
+
+def _sqlite_type(kind):
+    """SQLite declared type for an inferred dtype, following DataFrame.to_sql's mapping."""
+    if kind in ("datetime64", "datetime"):
+        return "TIMESTAMP"
+    if kind == "timedelta64":
+        return "INTEGER"
+    return _SQLITE_TYPES.get(kind, "TEXT")
+
+def _sqlite_values(column):
+    """
+    A Series as a list of values sqlite3 can bind, missing values as None.
+
+    Datetimes are written as ISO text ("YYYY-MM-DD HH:MM:SS[.ffffff]") and
+    timedeltas as integer nanoseconds, the same as DataFrame.to_sql.
+    """
+    kind = getattr(column.dtype, "kind", "O")
+    if kind == "M" and column.dt.tz is None:
+        # Formatted in bulk: datetime.isoformat(" ") drops the fraction when
+        # it is zero, which truncating to 19 characters reproduces
+        stamps = column.to_numpy(dtype="datetime64[us]")
+        text = np.char.replace(np.datetime_as_string(stamps, unit="us"), "T", " ")
+        text = np.where(stamps.view(np.int64) % 1_000_000 == 0, text.astype("U19"), text).tolist()
+        missing = np.isnat(stamps)
+        if missing.any():
+            text = [None if m else v for v, m in zip(text, missing.tolist())]
+        return text
+    if kind == "M":
+        return [None if v is pd.NaT else v.to_pydatetime(warn=False).isoformat(" ") for v in column.tolist()]
+    if kind == "m":
+        return [None if v is pd.NaT else v.value for v in column.tolist()]
+    values = column.tolist()
+    if column.hasnans:
+        values = [None if missing else v for v, missing in zip(values, column.isna().tolist())]
+    return values
+
+# Per-thread SQLite connections, reused across calls so the schema and page
+# cache stay warm. Each thread's connections are closed when the thread exits
+# (and at interpreter shutdown)
+_tls = threading.local()
+
+class _ThreadConnections:
+    """One thread's cached connections: absolute path -> ((st_dev, st_ino), connection)."""
+
+    __slots__ = ('conns', '__weakref__')
+
+    def __init__(self):
+        self.conns = {}
+
+def _close_connections(conns):
+    """Close and forget every connection in a _ThreadConnections.conns dict."""
+    for _, conn in conns.values():
+        conn.close()
+    conns.clear()
+
+def _file_id(path):
+    """(st_dev, st_ino) of ``path``, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+def _get_conn(db_filepath):
+    """
+    This thread's cached autocommit connection to ``db_filepath``.
+
+    Opened on first use with a 64 MB page cache and up to 1 GB of the file
+    memory-mapped for reads. If the file has been deleted or replaced since,
+    the stale connection is closed and a new one opened on the current file.
+    """
+    holder = getattr(_tls, 'holder', None)
+    if holder is None:
+        holder = _tls.holder = _ThreadConnections()
+        # The thread-local holder is dropped when its thread exits; the
+        # connections go with it
+        weakref.finalize(holder, _close_connections, holder.conns)
+    conns = holder.conns
+
+    path = os.path.abspath(db_filepath)
+    file_id = _file_id(path)
+    cached = conns.pop(path, None)
+    if cached is not None:
+        if cached[0] == file_id:
+            conns[path] = cached
+            return cached[1]
+        cached[1].close()
+
+    # check_same_thread is off only so the finalizer may close the connection
+    # from whichever thread collects the holder; it is used by its own thread
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=1073741824")
+    conns[path] = (_file_id(path), conn)
+    return conn
+
+def _table_exists(conn, table_name):
+    """True if ``table_name`` is a table in the connected database."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+    ).fetchone() is not None
+
+# Rows per DataFrame chunk when streaming a CSV into SQLite with pandas' parser
+CSV_CHUNK_ROWS = 100_000
+# Bytes of CSV per block when streaming it with pyarrow's reader
+CSV_BLOCK_BYTES = 1 << 20
+
+def _index_names(df):
+    """Column names DataFrame.to_sql gives the index levels."""
+    return [
+        name if name is not None else ('index' if df.index.nlevels == 1 else f'level_{i}')
+        for i, name in enumerate(df.index.names)
+    ]
+
+def _pandas_csv_chunks(csv_filepath):
+    """Parse a CSV file with pandas' parser into DataFrames of at most CSV_CHUNK_ROWS rows."""
+    with pd.read_csv(csv_filepath, chunksize=CSV_CHUNK_ROWS) as chunks:
+        yield from chunks
+
+def _arrow_csv_chunks(csv_filepath):
+    """
+    Stream a CSV file through Arrow's multi-threaded reader, one DataFrame per block.
+
+    Memory is bounded by the few blocks of CSV_BLOCK_BYTES the reader parses
+    ahead, not by the size of the file. Column types are inferred from the first block, the same way the chunked
+    pandas parser does it, except that columns Arrow would read as dates or
+    times are kept as text and all-empty columns become float NaN, as pandas
+    reads them. Raises pyarrow.ArrowInvalid when a later block does not fit
+    the first block's types.
+    """
+    read_options = pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES)
+    # The first block's inferred schema shows which columns look like dates or times
+    reader = pa_csv.open_csv(csv_filepath, read_options=read_options)
+    column_types = {
+        field.name: pa.string() for field in reader.schema if pa.types.is_temporal(field.type)
+    }
+    reader.close()
+
+    reader = pa_csv.open_csv(
+        csv_filepath,
+        read_options=read_options,
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+    )
+    try:
+        empty = True
+        for batch in reader:
+            if batch.num_rows == 0:
+                continue
+            empty = False
+            for i, field in enumerate(batch.schema):
+                if pa.types.is_null(field.type):
+                    batch = batch.set_column(i, field.name, pa.nulls(batch.num_rows, pa.float64()))
+            yield batch.to_pandas()
+        if empty:
+            # Header-only file: still create the (all-text) table
+            yield reader.schema.empty_table().to_pandas()
+    finally:
+        reader.close()
+
+def _create_table_sql(table, names, types):
+    """CREATE TABLE statement for a quoted table name and its column names and types."""
+    column_defs = ",\n  ".join(
+        f"{_quote_identifier(name)} {sqlite_type}" for name, sqlite_type in zip(names, types)
+    )
+    return f"CREATE TABLE {table} (\n{column_defs}\n)"
+
+def _write_frames(db_filepath, table_name, frames, if_exists, index):
+    """
+    Write an iterable of DataFrames to one SQLite table in one transaction.
+
+    The table is (re)created from the first frame's dtypes; every frame is
+    bulk-inserted with one prepared INSERT through sqlite3.executemany, so only
+    one frame needs to be in memory at a time. Column types, missing values
+    and datetime text match what DataFrame.to_sql writes for the whole data
+    at once: when a later frame widens a column of a table created here
+    (integers that turn out to be floats or text, say), the table is rebuilt
+    with the wider type and the rows already written are converted to it.
+    When the table is being replaced, fsyncs are turned off and temp storage
+    kept in memory for the load, and both are restored afterwards since the
+    connection is shared. The rollback journal stays on, so an error or a
+    crash of this process leaves the database as it was; only an OS crash or
+    power loss during the load can damage it. Raises on any error.
+
+    Returns:
+        int: The number of rows written.
+    """
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+    # Create directory for DB if it doesn't exist
+    db_dir = os.path.dirname(db_filepath)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+
+    conn = _get_conn(db_filepath)
+    exists = _table_exists(conn, table_name)
+    if exists and if_exists == 'fail':
+        raise ValueError(f"Table '{table_name}' already exists.")
+    if if_exists == 'replace':
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+    try:
+        if if_exists == 'replace':
+            # The journal still protects the rest of the database; only the
+            # fsyncs are skipped, as a rerun rebuilds the table anyway
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+
+        table = _quote_identifier(table_name)
+        rows = 0
+        insert_sql = None
+        kinds = None
+        conn.execute("BEGIN")
+        try:
+            for df in frames:
+                if index:
+                    index_names = _index_names(df)
+                    df = df.reset_index(names=index_names)
+                columns = [df.iloc[:, i] for i in range(df.shape[1])]
+
+                if insert_sql is None:
+                    if exists and if_exists == 'replace':
+                        conn.execute(f"DROP TABLE {table}")
+                    if not exists or if_exists == 'replace':
+                        kinds = [_column_kind(column) for column in columns]
+                        types = [_sqlite_type(kind) for kind in kinds]
+                        conn.execute(_create_table_sql(table, df.columns, types))
+                    column_names = ", ".join(_quote_identifier(name) for name in df.columns)
+                    placeholders = ", ".join("?" * len(columns))
+                    insert_sql = f"INSERT INTO {table} ({column_names}) VALUES ({placeholders})"
+                elif kinds is not None:
+                    kinds = [_merged_kind(kind, column) for kind, column in zip(kinds, columns)]
+                    widened = [_sqlite_type(kind) for kind in kinds]
+                    if widened != types:
+                        # SQLite cannot change a column's type; copy the rows
+                        # into a new table, whose column affinity converts them
+                        types = widened
+                        staging = _quote_identifier(f"{table_name}__widen")
+                        conn.execute(_create_table_sql(staging, df.columns, types))
+                        conn.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+                        conn.execute(f"DROP TABLE {table}")
+                        conn.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+
+                conn.executemany(insert_sql, zip(*(_sqlite_values(column) for column in columns)))
+                rows += len(df)
+            if index and kinds is not None:
+                index_cols = ", ".join(_quote_identifier(name) for name in index_names)
+                conn.execute(
+                    f"CREATE INDEX {_quote_identifier(f'ix_{table_name}_' + '_'.join(map(str, index_names)))} "
+                    f"ON {table} ({index_cols})"
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        if if_exists == 'replace':
+            conn.execute(f"PRAGMA synchronous={synchronous}")
+            conn.execute(f"PRAGMA temp_store={temp_store}")
+    return rows
 
 def df_to_sqlite(df, db_filepath, table_name, if_exists='replace', index=False):
     """
     Write a pandas DataFrame to a SQLite database table.
     
+    The rows are bulk-inserted with sqlite3.executemany inside a single
+    transaction instead of going through DataFrame.to_sql; see _write_frames.
+    
     Args:
         df (pandas.DataFrame): DataFrame to write to SQLite
         db_filepath (str): Path to the SQLite database file
@@ -28,26 +336,24 @@ def df_to_sqlite(df, db_filepath, table_name, if_exists='replace', index=False):
         bool: True if successful, False otherwise
     """
     try:
-        # Create directory for DB if it doesn't exist
-        db_dir = os.path.dirname(db_filepath)
-        if db_dir and not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-            
-        # Connect to SQLite DB and write DataFrame
-        conn = sqlite3.connect(db_filepath)
-        df.to_sql(table_name, conn, if_exists=if_exists, index=index)
-        conn.close()
+        _write_frames(db_filepath, table_name, (df,), if_exists, index)
         
-        logger.info(f"Successfully wrote {len(df)} rows to {table_name} in {db_filepath}")
+        logger.info("Successfully wrote %d rows to %s in %s", len(df), table_name, db_filepath)
         return True
     except Exception as e:
-        logger.error(f"Error writing DataFrame to SQLite: {e}")
+        logger.error("Error writing DataFrame to SQLite: %s", e)
         return False
 
 def csv_to_sqlite_table(csv_filepath, db_filepath, table_name, if_exists='replace'):
     """
     Read a CSV file and load it into a SQLite database table.
     
+    The CSV is streamed into SQLite a chunk at a time, all in one transaction,
+    so memory use does not grow with the file: with pyarrow installed it is
+    parsed in blocks of CSV_BLOCK_BYTES, otherwise (or if a later block does
+    not fit the column types inferred from the first) with pandas' parser in
+    chunks of CSV_CHUNK_ROWS rows.
+    
     Args:
         csv_filepath (str): Path to the CSV file
         db_filepath (str): Path to the SQLite database file
@@ -62,18 +368,24 @@ def csv_to_sqlite_table(csv_filepath, db_filepath, table_name, if_exists='replac
     """
     try:
         if not os.path.exists(csv_filepath):
-            logger.error(f"CSV file not found: {csv_filepath}")
+            logger.error("CSV file not found: %s", csv_filepath)
             return False
             
-        # Read CSV into DataFrame
-        df = pd.read_csv(csv_filepath)
-        logger.info(f"Read {len(df)} rows from {csv_filepath}")
+        if pa_csv is None:
+            rows = _write_frames(db_filepath, table_name, _pandas_csv_chunks(csv_filepath), if_exists, index=False)
+        else:
+            try:
+                rows = _write_frames(db_filepath, table_name, _arrow_csv_chunks(csv_filepath), if_exists, index=False)
+            except pa.ArrowInvalid as e:
+                # A later block did not fit the first block's column types; the
+                # failed load was rolled back, so parse again with pandas
+                logger.warning("Arrow could not parse %s (%s), retrying with pandas", csv_filepath, e)
+                rows = _write_frames(db_filepath, table_name, _pandas_csv_chunks(csv_filepath), if_exists, index=False)
         
-        # Write DataFrame to SQLite
-        result = df_to_sqlite(df, db_filepath, table_name, if_exists, index=False)
-        return result
+        logger.info("Wrote %d rows from %s to %s in %s", rows, csv_filepath, table_name, db_filepath)
+        return True
     except Exception as e:
-        logger.error(f"Error converting CSV to SQLite: {e}")
+        logger.error("Error converting CSV to SQLite: %s", e)
         return False
 
 def get_table_schema(db_filepath, table_name):
@@ -89,24 +401,36 @@ def get_table_schema(db_filepath, table_name):
     """
     try:
         if not os.path.exists(db_filepath):
-            logger.error(f"Database file not found: {db_filepath}")
+            logger.error("Database file not found: %s", db_filepath)
             return None
             
-        conn = sqlite3.connect(db_filepath)
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table_name}'")
-        schema = cursor.fetchone()
-        conn.close()
+        conn = _get_conn(db_filepath)
+        schema = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,)).fetchone()
         
         if schema:
             return schema[0]
         else:
-            logger.warning(f"Table {table_name} not found in {db_filepath}")
+            logger.warning("Table %s not found in %s", table_name, db_filepath)
             return None
     except Exception as e:
-        logger.error(f"Error getting table schema: {e}")
+        logger.error("Error getting table schema: %s", e)
         return None
 
+@lru_cache(maxsize=64)
+def _select_sql(table_name, columns, where_clause):
+    """
+    SELECT statement for query_sqlite_table, built once per distinct query.
+
+    The columns are used as written, not quoted: SQLite reads an unknown
+    double-quoted name as a string literal, which would turn a misspelt
+    column into a column of its own name instead of an error.
+    """
+    cols_str = ", ".join(columns) if columns else "*"
+    sql_query = f"SELECT {cols_str} FROM {_quote_identifier(table_name)}"
+    if where_clause:
+        sql_query += f" WHERE {where_clause}"
+    return sql_query
+
 def query_sqlite_table(db_filepath, table_name, query=None, columns=None, where_clause=None):
     """
     Query a SQLite table and return the results as a pandas DataFrame.
@@ -123,33 +447,94 @@ def query_sqlite_table(db_filepath, table_name, query=None, columns=None, where_
     """
     try:
         if not os.path.exists(db_filepath):
-            logger.error(f"Database file not found: {db_filepath}")
+            logger.error("Database file not found: %s", db_filepath)
             return pd.DataFrame()
             
-        conn = sqlite3.connect(db_filepath)
+        conn = _get_conn(db_filepath)
         
-        if query:
-            sql_query = query
-        else:
-            cols_str = ", ".join(columns) if columns else "*"
-            sql_query = f"SELECT {cols_str} FROM {table_name}"
-            if where_clause:
-                sql_query += f" WHERE {where_clause}"
+        sql_query = query or _select_sql(table_name, tuple(columns or ()), where_clause)
         
-        logger.info(f"Executing query: {sql_query}")
+        logger.debug("Executing query: %s", sql_query)
         df = pd.read_sql_query(sql_query, conn)
-        conn.close()
         
-        logger.info(f"Query returned {len(df)} rows")
+        logger.debug("Query returned %d rows", len(df))
         return df
     except Exception as e:
-        logger.error(f"Error querying SQLite table: {e}")
+        logger.error("Error querying SQLite table: %s", e)
         return pd.DataFrame()
 
+def _arrow_column(values):
+    """An Arrow array for one result column; columns mixing storage classes become text."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+def query_sqlite_table_arrow(db_filepath, table_name, query=None, columns=None, where_clause=None):
+    """
+    Query a SQLite table and return the results as a pyarrow Table.
+    
+    Takes the same arguments as query_sqlite_table. With adbc_driver_sqlite
+    installed the native driver fetches the rows straight into Arrow columns;
+    otherwise they are read through sqlite3 and built column by column without
+    going through a DataFrame. Numeric columns can be handed on as NumPy
+    arrays with ``table.column(name).to_numpy()``.
+    
+    Args:
+        db_filepath (str): Path to the SQLite database file
+        table_name (str): Name of the table to query
+        query (str, optional): Full SQL query to execute. If provided, overrides columns and where_clause
+        columns (list, optional): List of column names to select. If None, selects all columns (*)
+        where_clause (str, optional): WHERE clause for the query. If None, no filtering is applied
+        
+    Returns:
+        pyarrow.Table: Query results or None if error
+    """
+    try:
+        if not os.path.exists(db_filepath):
+            logger.error("Database file not found: %s", db_filepath)
+            return None
+        if pa_csv is None:
+            logger.error("pyarrow is required for query_sqlite_table_arrow")
+            return None
+            
+        sql_query = query or _select_sql(table_name, tuple(columns or ()), where_clause)
+        logger.debug("Executing query: %s", sql_query)
+        
+        try:
+            import adbc_driver_sqlite.dbapi as adbc_sqlite
+        except ImportError:
+            adbc_sqlite = None
+        
+        if adbc_sqlite is not None:
+            with adbc_sqlite.connect(os.path.abspath(db_filepath)) as conn, conn.cursor() as cursor:
+                cursor.execute(sql_query)
+                table = cursor.fetch_arrow_table()
+        else:
+            cursor = _get_conn(db_filepath).execute(sql_query)
+            names = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
+            if rows:
+                arrays = [_arrow_column(values) for values in zip(*rows)]
+            else:
+                arrays = [pa.array([], type=pa.null()) for _ in names]
+            table = pa.Table.from_arrays(arrays, names=names)
+        
+        logger.debug("Query returned %d rows", table.num_rows)
+        return table
+    except Exception as e:
+        logger.error("Error querying SQLite table: %s", e)
+        return None
+
 # For standalone testing
 if __name__ == "__main__":
     import sys
     
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     if len(sys.argv) < 3:
         print("Usage: python csv_to_sqlite.py <csv_file> <db_file> [table_name]")
         sys.exit(1)
@@ -1,4 +1,52 @@
 # Modified version without monitoring decorator
+import numpy as np
+
+from ._price_core import tt_bond_parts_batch
+
+# "'XXY" suffix for each number of 64ths: XX full 32nds (0-padded), Y 5 for an
+# extra half 32nd. Formatting a price is then one str() and one concatenation.
+_SUFFIX64 = tuple(f"'{n32:02d}{half * 5}" for n32 in range(32) for half in (0, 1))
+_SUFFIX64_ARRAY = np.array(_SUFFIX64)
+
+def _format_parts(whole_part, num_sixty_fourths):
+    """WHOLE'XXY for a negative number of 64ths, which the suffix table does not cover."""
+    num_full_32nds, half = divmod(num_sixty_fourths, 2)
+    return f"{whole_part}'{num_full_32nds:02d}{half * 5}"
+
+def _tt_bond_parts(decimal_price):
+    """(whole points, number of 64ths) of a price, with a rounded-up 64/64 carried into the whole part."""
+    if not isinstance(decimal_price, (int, float)):
+        raise TypeError("Input price must be a number.")
+
+    whole_part = int(decimal_price)
+
+    # Total number of 1/64ths in the fractional part of the price
+    # E.g., if price is 110.015625 (110 and 1/64), num_sixty_fourths = 1
+    # E.g., if price is 110.03125 (110 and 2/64 or 1/32), num_sixty_fourths = 2
+    # E.g., if price is 110.046875 (110 and 3/64), num_sixty_fourths = 3
+    num_sixty_fourths = round((decimal_price - whole_part) * 64.0)
+    if num_sixty_fourths == 64:
+        # The fraction rounded up to a whole point (e.g. 110.999 -> 111'000)
+        whole_part += 1
+        num_sixty_fourths = 0
+    return whole_part, num_sixty_fourths
+
+def decimal_to_tt_bond_components(decimal_price):
+    """
+    The numeric parts of a price's TT bond format, without building the string.
+
+    For callers that sort or index ladder rows by tick rather than display
+    them; decimal_to_tt_bond_format(p) is "{whole}'{n32:02d}{half * 5}" of these.
+
+    Args:
+        decimal_price (float): The price as a decimal number.
+
+    Returns:
+        tuple[int, int, int]: (whole points, full 32nds, 1 if there is an extra half 32nd else 0).
+    """
+    whole_part, num_sixty_fourths = _tt_bond_parts(decimal_price)
+    return (whole_part, *divmod(num_sixty_fourths, 2))
+
 def decimal_to_tt_bond_format(decimal_price):
     """
     Converts a decimal price to the TT bond style string format (e.g., 110.015625 -> "110'005").
@@ -11,36 +59,52 @@ def decimal_to_tt_bond_format(decimal_price):
     Returns:
         str: The price formatted as a TT bond style string.
     """
-    if not isinstance(decimal_price, (int, float)):
-        raise TypeError("Input price must be a number.")
+    whole_part, num_sixty_fourths = _tt_bond_parts(decimal_price)
 
-    whole_part = int(decimal_price)
-    
-    # Calculate total sixty-fourths for the fractional part
-    # Add a small epsilon to handle potential floating point representation issues before rounding
-    # E.g., if decimal_price = 110.01562499999, fractional_value might be slightly less than 0.015625.
-    # Multiplying by 64 and then rounding handles this robustly.
-    fractional_value = decimal_price - whole_part
-    
-    # Total number of 1/64ths in the fractional part of the price
-    # E.g., if price is 110.015625 (110 and 1/64), num_sixty_fourths = 1
-    # E.g., if price is 110.03125 (110 and 2/64 or 1/32), num_sixty_fourths = 2
-    # E.g., if price is 110.046875 (110 and 3/64), num_sixty_fourths = 3
-    num_sixty_fourths = round(fractional_value * 64.0)
-
-    # Number of full 32nds
-    # E.g., 1/64 -> 0 full 32nds. 2/64 -> 1 full 32nd. 3/64 -> 1 full 32nd.
-    num_full_32nds = int(num_sixty_fourths // 2)
-    
-    # Check if there is an extra half of a 32nd (i.e., an odd number of 64ths)
-    # E.g., 1/64 -> has_half_32nd_extra = 1. 2/64 -> has_half_32nd_extra = 0. 3/64 -> has_half_32nd_extra = 1.
-    has_half_32nd_extra = int(num_sixty_fourths % 2)
-    
     # Format: WHOLE'XXY where XX is num_full_32nds (0-padded) and Y is 0 or 5
-    # Example: 110 and 1/64 -> 110, num_full_32nds=0, has_half=1 -> "110'005"
-    # Example: 110 and 2/64 (1/32) -> 110, num_full_32nds=1, has_half=0 -> "110'010"
-    # Example: 110 and 3/64 -> 110, num_full_32nds=1, has_half=1 -> "110'015"
-    return f"{whole_part}'{num_full_32nds:02d}{5 if has_half_32nd_extra else 0}"
+    # Example: 110 and 1/64 -> "110" + _SUFFIX64[1] -> "110'005"
+    # Example: 110 and 2/64 (1/32) -> "110" + _SUFFIX64[2] -> "110'010"
+    # Example: 110 and 3/64 -> "110" + _SUFFIX64[3] -> "110'015"
+    if num_sixty_fourths >= 0:
+        return str(whole_part) + _SUFFIX64[num_sixty_fourths]
+    return _format_parts(whole_part, num_sixty_fourths)
+
+def decimal_to_tt_bond_format_array(decimal_prices):
+    """
+    Vectorized decimal_to_tt_bond_format for a whole ladder of prices.
+
+    The parts come from one native loop (_price_core.tt_bond_parts_batch) and
+    each string is the whole part joined to its _SUFFIX64 entry, so formatting
+    hundreds of levels costs a handful of C loops instead of one Python call
+    per price.
+
+    Args:
+        decimal_prices (array-like): Prices as decimal numbers.
+
+    Returns:
+        np.ndarray: The TT bond style strings, same shape as the input.
+
+    Raises:
+        ValueError: If any price is NaN or infinite.
+    """
+    prices = np.asarray(decimal_prices, dtype=np.float64)
+    shape = prices.shape
+    prices = np.ascontiguousarray(prices.ravel())
+    if not np.isfinite(prices).all():
+        # The native loop would cast NaN/inf to an arbitrary int64
+        raise ValueError("cannot convert a NaN or infinite price to TT bond format")
+    whole_part = np.empty(prices.shape[0], dtype=np.int64)
+    num_sixty_fourths = np.empty_like(whole_part)
+    tt_bond_parts_batch(prices, whole_part, num_sixty_fourths)
+
+    negative = num_sixty_fourths < 0
+    formatted = np.char.add(whole_part.astype(str), _SUFFIX64_ARRAY[np.where(negative, 0, num_sixty_fourths)])
+    if negative.any():
+        formatted = formatted.astype(object)
+        for i in np.flatnonzero(negative):
+            formatted[i] = _format_parts(whole_part[i], num_sixty_fourths[i])
+        formatted = formatted.astype(str)
+    return formatted.reshape(shape)
 
 if __name__ == '__main__':
     # Test cases
@@ -1,5 +1,7 @@
 """TT REST API integration modules"""
 
+import importlib
+
 from .utils import (
     generate_guid,
     create_request_id,
@@ -7,12 +9,28 @@ from .utils import (
     format_bearer_token,
     is_valid_guid
 )
-from .token_manager import TTTokenManager
-from .config import (
-    APP_NAME, COMPANY_NAME,
-    TT_API_KEY, TT_API_SECRET, TT_SIM_API_KEY, TT_SIM_API_SECRET,
-    ENVIRONMENT, TOKEN_FILE, AUTO_REFRESH, REFRESH_BUFFER_SECONDS
-)
+
+# The token manager (which pulls in requests) and the config values are only
+# imported when first referenced, so importing the package stays cheap
+_LAZY = {
+    "TTTokenManager": ".token_manager",
+    **dict.fromkeys(
+        (
+            "APP_NAME", "COMPANY_NAME",
+            "TT_API_KEY", "TT_API_SECRET", "TT_SIM_API_KEY", "TT_SIM_API_SECRET",
+            "ENVIRONMENT", "TOKEN_FILE", "AUTO_REFRESH", "REFRESH_BUFFER_SECONDS",
+        ),
+        ".config",
+    ),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Utils functions
@@ -1,14 +1,19 @@
 """
 Configuration file for Trading Technologies API tokens and settings.
+
+The credentials can be overridden with environment variables of the same name
+and ENVIRONMENT with TT_ENVIRONMENT; the values below are only the fallbacks.
 """
 
+import os
+
 # API credentials
-TT_API_KEY = "0549df41-77a8-6799-1a7d-b2f4656a7fd4"  # UAT Key
-TT_API_SECRET = "12d0bbbb-9f1b-caff-e9d3-19212d8426c2"  # UAT Secret
+TT_API_KEY = os.environ.get("TT_API_KEY", "0549df41-77a8-6799-1a7d-b2f4656a7fd4")  # UAT Key
+TT_API_SECRET = os.environ.get("TT_API_SECRET", "12d0bbbb-9f1b-caff-e9d3-19212d8426c2")  # UAT Secret
 
 # SIM Environment credentials
-TT_SIM_API_KEY = "2b429b91-8d96-8aed-4338-3d3d5b73887a"
-TT_SIM_API_SECRET = "8d9f572e-292e-c7a0-c39d-383fbfb56b8b"
+TT_SIM_API_KEY = os.environ.get("TT_SIM_API_KEY", "2b429b91-8d96-8aed-4338-3d3d5b73887a")
+TT_SIM_API_SECRET = os.environ.get("TT_SIM_API_SECRET", "8d9f572e-292e-c7a0-c39d-383fbfb56b8b")
 
 # Application identifiers
 APP_NAME = "UIKitXTT"  # Used in request IDs
@@ -16,7 +21,7 @@ COMPANY_NAME = "Fibonacci Research"  # Used in request IDs
 
 # Environment settings
 # Use 'UAT' for testing/development, 'LIVE' for production, 'SIM' for simulation
-ENVIRONMENT = "SIM"
+ENVIRONMENT = os.environ.get("TT_ENVIRONMENT", "SIM")
 
 # Token settings
 TOKEN_FILE = "tt_token.json"  # Base filename; path and suffix (_uat, _sim) are resolved in token_manager.py